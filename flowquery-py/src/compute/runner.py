@@ -11,6 +11,7 @@ from ..graph.relationship import Relationship as GraphRelationship
 from ..parsing.ast_node import ASTNode
 from ..parsing.expressions.binding_reference import BindingReference
 from ..parsing.expressions.parameter_reference import ParameterReference
+from ..parsing.functions.temporal_utils import start_statement_clock, stop_statement_clock
 from ..parsing.operations.aggregated_with import AggregatedWith
 from ..parsing.operations.create_node import CreateNode
 from ..parsing.operations.create_relationship import CreateRelationship
@@ -266,9 +267,14 @@ class Runner:
             self._collect_binding_names(stmt.ast, names)
             for name in names:
                 await bindings_singleton.materialize(name)
-            await stmt.first.initialize()
-            await stmt.first.run()
-            await stmt.first.finish()
+            # One "now" per statement, shared with any sub-queries it runs
+            clock = start_statement_clock()
+            try:
+                await stmt.first.initialize()
+                await stmt.first.run()
+                await stmt.first.finish()
+            finally:
+                stop_statement_clock(clock)
 
     def _enable_provenance(self) -> None:
         """Walks the terminal statement's operation chain and wires
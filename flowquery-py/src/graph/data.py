@@ -1,59 +1,100 @@
 """Data class for graph record iteration and indexing."""
 
-from typing import Any, Dict, List, Optional
-
-
-class IndexEntry:
-    """Index entry for tracking positions of records with a specific key value."""
-
-    def __init__(self, positions: Optional[List[int]] = None):
-        self._positions: List[int] = positions if positions is not None else []
-        self._index: int = -1
-
-    def add(self, position: int) -> None:
-        """Add a position to the index entry."""
-        self._positions.append(position)
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class Index:
+    """Compressed-sparse-row index over the values of a single record key.
+
+    Each distinct value is assigned a dense key id.  Record positions for
+    key id ``k`` are stored contiguously in ``positions`` between
+    ``offsets[k]`` and ``offsets[k + 1]``, so a relationship index on
+    ``left_id`` or ``right_id`` is the adjacency list of the graph.  The
+    index is immutable after construction and is shared by all layers.
+
+    String values are interned, and written back to their records, so ids
+    read from one record set and looked up in another usually resolve by
+    identity rather than by string comparison.
+    """
+
+    __slots__ = ("_key_ids", "_offsets", "_positions")
+
+    def __init__(self, key_ids: Dict[Any, int], counts: List[int], record_key_ids: List[int]):
+        """Lay out an index from the per-record key ids gathered by build()."""
+        self._key_ids: Dict[Any, int] = key_ids
+        self._offsets: array[int] = array("q", [0]) * (len(counts) + 1)
+        for key_id, count in enumerate(counts):
+            self._offsets[key_id + 1] = self._offsets[key_id] + count
+        # A stable sort by key id groups the positions in one C-level pass;
+        # records without the key sort first and are dropped.
+        order = sorted(range(len(record_key_ids)), key=record_key_ids.__getitem__)
+        missing = len(record_key_ids) - self._offsets[-1]
+        self._positions: array[int] = array("q", order[missing:])
+
+    @staticmethod
+    def build(records: List[Dict[str, Any]], keys: Sequence[str]) -> List["Index"]:
+        """Build one index per key in a single pass over the records."""
+        key_ids: List[Dict[Any, int]] = [{} for _ in keys]
+        counts: List[List[int]] = [[] for _ in keys]
+        # Key id of every record, -1 when the record lacks the key
+        record_key_ids: List[List[int]] = [[] for _ in keys]
+        columns = list(zip(keys, key_ids, counts, record_key_ids))
+        for record in records:
+            for key, ids, key_counts, record_ids in columns:
+                if key in record:
+                    value = record[key]
+                    if type(value) is str:
+                        value = record[key] = sys.intern(value)
+                    key_id = ids.setdefault(value, len(key_counts))
+                    if key_id == len(key_counts):
+                        key_counts.append(1)
+                    else:
+                        key_counts[key_id] += 1
+                    record_ids.append(key_id)
+                else:
+                    record_ids.append(-1)
+        return [Index(*column[1:]) for column in columns]
 
     @property
-    def position(self) -> int:
-        """Get the current position."""
-        return self._positions[self._index]
+    def key_ids(self) -> Dict[Any, int]:
+        """Get the dense key id of each distinct value."""
+        return self._key_ids
 
-    def reset(self) -> None:
-        """Reset the index to the beginning."""
-        self._index = -1
+    @property
+    def offsets(self) -> "array[int]":
+        """Get the start offset of each key id, plus the total length."""
+        return self._offsets
 
-    def next(self) -> bool:
-        """Move to the next position. Returns True if successful."""
-        if self._index < len(self._positions) - 1:
-            self._index += 1
-            return True
-        return False
+    @property
+    def positions(self) -> "array[int]":
+        """Get the record positions, grouped by key id."""
+        return self._positions
 
-    def clone(self) -> "IndexEntry":
-        """Create a copy of this index entry.
 
-        Shares the underlying positions list since it is immutable after
-        index construction.  Only the iteration cursor is independent.
-        """
-        return IndexEntry(self._positions)
+class Layer:
+    """Layer for managing index state at a specific level.
 
+    Indexes are shared between layers; each layer only owns its cursors.
+    Cursors are kept sparsely, per key id that has been visited, so that
+    creating or resetting a layer does not scale with the number of keys.
+    """
 
-class Layer:
-    """Layer for managing index state at a specific level."""
+    __slots__ = ("_indexes", "_cursors", "_current")
 
-    def __init__(self, indexes: Dict[str, Dict[str, IndexEntry]]):
-        self._indexes: Dict[str, Dict[str, IndexEntry]] = indexes
+    def __init__(self, indexes: Dict[str, Index]):
+        self._indexes: Dict[str, Index] = indexes
+        self._cursors: Dict[str, Dict[int, int]] = {name: {} for name in indexes}
         self._current: int = -1
 
-    def index(self, name: str) -> Dict[str, IndexEntry]:
-        """Get or create an index by name."""
-        if name not in self._indexes:
-            self._indexes[name] = {}
-        return self._indexes[name]
+    def add_index(self, name: str, index: Index) -> None:
+        """Add or replace an index by name."""
+        self._indexes[name] = index
+        self._cursors[name] = {}
 
     @property
-    def indexes(self) -> Dict[str, Dict[str, IndexEntry]]:
+    def indexes(self) -> Dict[str, Index]:
         """Get all indexes."""
         return self._indexes
 
@@ -67,74 +108,98 @@ class Layer:
         """Set the current position."""
         self._current = value
 
+    def next_position(self, name: str, value: Any) -> int:
+        """Advance the cursor for value in the named index.
+
+        Returns the next record position, or -1 when exhausted.
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            return -1
+        key_id = index.key_ids.get(value)
+        if key_id is None:
+            return -1
+        offsets = index.offsets
+        cursors = self._cursors[name]
+        cursor = cursors.get(key_id, -1) + 1
+        position = offsets[key_id] + cursor
+        if position >= offsets[key_id + 1]:
+            return -1
+        cursors[key_id] = cursor
+        return index.positions[position]
+
+    def reset(self) -> None:
+        """Reset the current position and all cursors."""
+        self._current = -1
+        for cursors in self._cursors.values():
+            cursors.clear()
+
+    def clone(self) -> "Layer":
+        """Create a layer sharing this layer's indexes with fresh cursors."""
+        return Layer(dict(self._indexes))
+
 
 class Data:
     """Base class for graph data with record iteration and indexing."""
 
+    __slots__ = ("_records", "_layers", "_layer0", "_primary_index")
+
     def __init__(self, records: Optional[List[Dict[str, Any]]] = None):
         self._records: List[Dict[str, Any]] = records if records is not None else []
         self._layers: Dict[int, Layer] = {0: Layer({})}
+        # Layer 0 is the one nearly every scan uses; bind it directly
+        self._layer0: Layer = self._layers[0]
+        # Index used by _find when no index name is given: the first one built
+        self._primary_index: Optional[str] = None
 
     def _build_index(self, key: str, level: int = 0) -> None:
         """Build an index for the given key at the specified level."""
-        idx = self.layer(level).index(key)
-        idx.clear()
-        for i, record in enumerate(self._records):
-            if key in record:
-                if record[key] not in idx:
-                    idx[record[key]] = IndexEntry()
-                idx[record[key]].add(i)
+        self._build_indexes((key,), level)
+
+    def _build_indexes(self, keys: Sequence[str], level: int = 0) -> None:
+        """Build indexes for the given keys in one pass over the records."""
+        layer = self.layer(level)
+        for key, index in zip(keys, Index.build(self._records, keys)):
+            layer.add_index(key, index)
+        if self._primary_index is None and keys:
+            self._primary_index = keys[0]
 
     def layer(self, level: int = 0) -> Layer:
         """Get or create a layer at the specified level."""
-        if level not in self._layers:
-            first = self._layers[0]
-            cloned_indexes = {}
-            for name, index_map in first.indexes.items():
-                cloned_map = {}
-                for key, entry in index_map.items():
-                    cloned_map[key] = entry.clone()
-                cloned_indexes[name] = cloned_map
-            self._layers[level] = Layer(cloned_indexes)
-        return self._layers[level]
+        layer = self._layers.get(level)
+        if layer is None:
+            layer = self._layers[level] = self._layer0.clone()
+        return layer
 
     def _find(self, key: str, level: int = 0, index_name: Optional[str] = None) -> bool:
         """Find the next record with the given key value."""
-        idx: Optional[Dict[str, IndexEntry]] = None
-        if index_name:
-            idx = self.layer(level).index(index_name)
-        else:
-            indexes = self.layer(level).indexes
-            idx = next(iter(indexes.values())) if indexes else None
-        if not idx or key not in idx:
-            self.layer(level).current = len(self._records)  # Move to end
+        layer = self._layer0 if level == 0 else self.layer(level)
+        name = index_name or self._primary_index
+        position = layer.next_position(name, key) if name else -1
+        if position < 0:
+            layer.current = len(self._records)  # Move to end
             return False
-        else:
-            entry = idx[key]
-            more = entry.next()
-            if not more:
-                self.layer(level).current = len(self._records)  # Move to end
-                return False
-            self.layer(level).current = entry.position
-            return True
+        layer.current = position
+        return True
 
     def reset(self) -> None:
         """Reset iteration to the beginning."""
         for layer in self._layers.values():
-            layer.current = -1
-            for index_map in layer.indexes.values():
-                for entry in index_map.values():
-                    entry.reset()
+            layer.reset()
 
     def next(self, level: int = 0) -> bool:
         """Move to the next record. Returns True if successful."""
-        if self.layer(level).current < len(self._records) - 1:
-            self.layer(level).current += 1
+        layer = self._layer0 if level == 0 else self.layer(level)
+        current = layer.current
+        if current < len(self._records) - 1:
+            layer.current = current + 1
             return True
         return False
 
     def current(self, level: int = 0) -> Optional[Dict[str, Any]]:
         """Get the current record."""
-        if self.layer(level).current < len(self._records):
-            return self._records[self.layer(level).current]
+        layer = self._layer0 if level == 0 else self.layer(level)
+        current = layer.current
+        if current < len(self._records):
+            return self._records[current]
         return None
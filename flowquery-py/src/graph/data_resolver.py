@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import sys
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from .data_cache import DataCache
@@ -46,109 +48,142 @@ class DataResolver:
         return [item async for item in self._schema()]
 
     async def _schema(self) -> AsyncIterator[Dict[str, Any]]:
-        """Async generator for graph schema."""
+        """Async generator for graph schema.
+
+        All node and relationship sub-queries are started concurrently;
+        entries are still yielded in registration order.
+        """
         db = Database.get_instance()
-        for label, physical_node in db.nodes.items():
-            records = await physical_node.data()
+        nodes = list(db.nodes.items())
+        relationships = [
+            (rel_type, physical_rel)
+            for rel_type, type_map in db.relationships.items()
+            for physical_rel in type_map.values()
+        ]
+        results = await asyncio.gather(
+            *(physical_node.data() for _, physical_node in nodes),
+            *(physical_rel.data() for _, physical_rel in relationships),
+        )
+        node_results = results[:len(nodes)]
+        rel_results = results[len(nodes):]
+
+        for (label, physical_node), records in zip(nodes, node_results):
             entry: Dict[str, Any] = {"kind": "Node", "label": label}
             if records:
-                sample = {k: v for k, v in records[0].items() if k != "id"}
+                sample = physical_node.schema_sample(records)
                 properties = list(sample.keys())
                 if properties:
                     entry["properties"] = properties
                     entry["sample"] = sample
             yield entry
 
-        for rel_type, type_map in db.relationships.items():
-            for physical_rel in type_map.values():
-                records = await physical_rel.data()
-                entry_rel: Dict[str, Any] = {
-                    "kind": "Relationship",
-                    "type": rel_type,
-                    "from_label": physical_rel.source.label if physical_rel.source else None,
-                    "to_label": physical_rel.target.label if physical_rel.target else None,
-                }
-                if records:
-                    sample = {
-                        k: v for k, v in records[0].items()
-                        if k not in ("left_id", "right_id")
-                    }
-                    properties = list(sample.keys())
-                    if properties:
-                        entry_rel["properties"] = properties
-                        entry_rel["sample"] = sample
-                yield entry_rel
+        for (rel_type, physical_rel), records in zip(relationships, rel_results):
+            entry_rel: Dict[str, Any] = {
+                "kind": "Relationship",
+                "type": rel_type,
+                "from_label": physical_rel.source.label if physical_rel.source else None,
+                "to_label": physical_rel.target.label if physical_rel.target else None,
+            }
+            if records:
+                sample = physical_rel.schema_sample(records)
+                properties = list(sample.keys())
+                if properties:
+                    entry_rel["properties"] = properties
+                    entry_rel["sample"] = sample
+            yield entry_rel
 
     async def get_data(
         self, element: Union['Node', 'Relationship']
     ) -> Union['NodeData', 'RelationshipData']:
         """Gets data for a node or relationship."""
-        db = Database.get_instance()
         if isinstance(element, Node):
-            args = DataResolver._extract_args(element.properties)
-            if len(element.labels) == 0:
-                all_records = []
-                for label, physical in db.nodes.items():
-                    data = await self._data_cache.get(f"node:{label}", physical, None)
+            return await self.get_node_data(element)
+        elif isinstance(element, Relationship):
+            return await self.get_relationship_data(element)
+        else:
+            raise ValueError("Element is neither Node nor Relationship")
+
+    async def get_node_data(self, element: 'Node') -> 'NodeData':
+        """Gets data for a node, merging all labels it may match."""
+        db = Database.get_instance()
+        args = DataResolver._extract_args(element.properties)
+        if len(element.labels) == 0:
+            all_records = []
+            for label, physical in db.nodes.items():
+                data = await self._data_cache.get(f"node:{label}", physical, None)
+                for record in data:
+                    enriched = {**record, "_label": label}
+                    src = get_virtual_source(record)
+                    if src is not None:
+                        attach_virtual_source(enriched, src)
+                    all_records.append(enriched)
+            return NodeData(all_records)
+        if len(element.labels) > 1:
+            all_records = []
+            for lbl in element.labels:
+                phys_node = db.nodes.get(lbl)
+                if phys_node:
+                    data = await self._data_cache.get(f"node:{lbl}", phys_node, args)
                     for record in data:
-                        enriched = {**record, "_label": label}
+                        enriched = {**record, "_label": lbl}
                         src = get_virtual_source(record)
                         if src is not None:
                             attach_virtual_source(enriched, src)
                         all_records.append(enriched)
-                return NodeData(all_records)
-            if len(element.labels) > 1:
-                all_records = []
-                for lbl in element.labels:
-                    phys_node = db.nodes.get(lbl)
-                    if phys_node:
-                        data = await self._data_cache.get(f"node:{lbl}", phys_node, args)
-                        for record in data:
-                            enriched = {**record, "_label": lbl}
-                            src = get_virtual_source(record)
-                            if src is not None:
-                                attach_virtual_source(enriched, src)
-                            all_records.append(enriched)
-                return NodeData(all_records)
-            node = db.get_node(element)
-            if node is None:
-                raise ValueError(f"Physical node not found for label {element.label}")
-            data = await self._data_cache.get(f"node:{element.label}", node, args)
-            label = element.label or ""
-            records: List[Dict[str, Any]] = []
-            for record in data:
-                enriched = {**record, "_label": label}
-                src = get_virtual_source(record)
-                if src is not None:
-                    attach_virtual_source(enriched, src)
-                records.append(enriched)
-            return NodeData(records)
-        elif isinstance(element, Relationship):
-            args = DataResolver._extract_args(element.properties)
-            entries = self._get_relationship_entries(element, db)
-            if not entries:
-                if len(element.types) == 0:
-                    return RelationshipData([])
-                suffix = "s" if len(element.types) > 1 else ""
-                types = ", ".join(element.types)
-                raise ValueError(
-                    f"No physical relationships found for type{suffix} {types}"
-                )
-            all_records = []
-            for type_name, phys_rel in entries:
-                rel_src = phys_rel.source.label if phys_rel.source else None
-                rel_tgt = phys_rel.target.label if phys_rel.target else None
-                cache_key = f"rel:{rel_src or ''}:{type_name}:{rel_tgt or ''}"
-                rel_records = await self._data_cache.get(cache_key, phys_rel, args)
+            return NodeData(all_records)
+        node = db.get_node(element)
+        if node is None:
+            raise ValueError(f"Physical node not found for label {element.label}")
+        data = await self._data_cache.get(f"node:{element.label}", node, args)
+        label = element.label or ""
+        records: List[Dict[str, Any]] = []
+        for record in data:
+            enriched = {**record, "_label": label}
+            src = get_virtual_source(record)
+            if src is not None:
+                attach_virtual_source(enriched, src)
+            records.append(enriched)
+        return NodeData(records)
+
+    async def get_relationship_data(self, element: 'Relationship') -> 'RelationshipData':
+        """Gets data for a relationship, merging all compatible types."""
+        db = Database.get_instance()
+        args = DataResolver._extract_args(element.properties)
+        entries = self._get_relationship_entries(element, db)
+        if not entries:
+            if len(element.types) == 0:
+                return RelationshipData([])
+            suffix = "s" if len(element.types) > 1 else ""
+            types = ", ".join(element.types)
+            raise ValueError(
+                f"No physical relationships found for type{suffix} {types}"
+            )
+        all_records = []
+        for type_name, phys_rel in entries:
+            # Interned once per type, so every tagged record, and every
+            # match record built from it, shares one string object
+            type_name = sys.intern(type_name)
+            rel_src = phys_rel.source.label if phys_rel.source else None
+            rel_tgt = phys_rel.target.label if phys_rel.target else None
+            cache_key = f"rel:{rel_src or ''}:{type_name}:{rel_tgt or ''}"
+            rel_records = await self._data_cache.get(cache_key, phys_rel, args)
+            if phys_rel.is_static:
+                # The physical relationship keeps STATIC results and hands
+                # the same records to every caller, so tag copies
                 for record in rel_records:
                     enriched = {**record, "_type": type_name}
                     rec_src = get_virtual_source(record)
                     if rec_src is not None:
                         attach_virtual_source(enriched, rec_src)
                     all_records.append(enriched)
-            return RelationshipData(all_records)
-        else:
-            raise ValueError("Element is neither Node nor Relationship")
+            else:
+                # Freshly executed for this read: tag in place rather than
+                # copying, since a physical relationship only yields
+                # records of its own type
+                for record in rel_records:
+                    record["_type"] = type_name
+                all_records.extend(rel_records)
+        return RelationshipData(all_records)
 
     @staticmethod
     def _resolve_labels(node: Optional['Node']) -> List[str]:
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional
+import itertools
+from typing import Dict, Iterator, Optional
 
 from ..parsing.ast_node import ASTNode
 from .node import Node
@@ -15,8 +16,15 @@ class Database:
     """Singleton registry for virtual node and relationship definitions."""
 
     _instance: Optional['Database'] = None
-    _nodes: Dict[str, 'PhysicalNode'] = {}
-    _relationships: Dict[str, Dict[str, 'PhysicalRelationship']] = {}
+    # Shared across instances so epochs never collide between registries
+    _epochs: Iterator[int] = itertools.count()
+
+    def __init__(self) -> None:
+        self._nodes: Dict[str, 'PhysicalNode'] = {}
+        self._relationships: Dict[str, Dict[str, 'PhysicalRelationship']] = {}
+        # Changes on every registry update to invalidate lookups memoized
+        # on Node/Relationship instances by get_node/get_relationship.
+        self._epoch: int = next(Database._epochs)
 
     @classmethod
     def get_instance(cls) -> 'Database':
@@ -27,12 +35,12 @@ class Database:
     @property
     def nodes(self) -> Dict[str, 'PhysicalNode']:
         """Read-only access to registered nodes."""
-        return Database._nodes
+        return self._nodes
 
     @property
     def relationships(self) -> Dict[str, Dict[str, 'PhysicalRelationship']]:
         """Read-only access to registered relationships (type -> endpoint_key -> physical)."""
-        return Database._relationships
+        return self._relationships
 
     def add_node(
         self,
@@ -44,7 +52,7 @@ class Database:
         """Adds a node to the database."""
         if node.label is None:
             raise ValueError("Node label is null")
-        existing = Database._nodes.get(node.label)
+        existing = self._nodes.get(node.label)
         if existing is not None and (existing.is_static or is_static):
             raise ValueError(
                 f"Virtual node (:{node.label}) already exists; "
@@ -54,26 +62,33 @@ class Database:
         physical.statement = statement
         physical.is_static = is_static
         physical.refresh_every_ms = refresh_every_ms
-        Database._nodes[node.label] = physical
+        self._nodes[node.label] = physical
+        self._epoch = next(Database._epochs)
 
     def remove_node(self, node: 'Node') -> None:
         """Removes a node from the database."""
         if node.label is None:
             raise ValueError("Node label is null")
-        Database._nodes.pop(node.label, None)
+        self._nodes.pop(node.label, None)
+        self._epoch = next(Database._epochs)
 
     def refresh_node(self, node: 'Node') -> None:
         """Invalidates the cache of a STATIC virtual node."""
         if node.label is None:
             raise ValueError("Node label is null")
-        physical = Database._nodes.get(node.label)
+        physical = self._nodes.get(node.label)
         if physical is None:
             raise ValueError(f"Virtual node (:{node.label}) does not exist")
         physical.invalidate_cache()
 
     def get_node(self, node: 'Node') -> Optional['PhysicalNode']:
         """Gets a node from the database."""
-        return Database._nodes.get(node.label) if node.label else None
+        if getattr(node, "_physical_epoch", -1) == self._epoch:
+            return node._physical_cache
+        physical = self._nodes.get(node.label) if node.label else None
+        node._physical_cache = physical
+        node._physical_epoch = self._epoch
+        return physical
 
     @staticmethod
     def _endpoint_key(
@@ -96,7 +111,7 @@ class Database:
             relationship.source.label if relationship.source else None,
             relationship.target.label if relationship.target else None,
         )
-        type_map = Database._relationships.get(relationship.type)
+        type_map = self._relationships.get(relationship.type)
         existing = type_map.get(key) if type_map is not None else None
         if existing is not None and (existing.is_static or is_static):
             src = relationship.source.label if relationship.source else ""
@@ -117,14 +132,15 @@ class Database:
         physical.refresh_every_ms = refresh_every_ms
         if type_map is None:
             type_map = {}
-            Database._relationships[relationship.type] = type_map
+            self._relationships[relationship.type] = type_map
         type_map[key] = physical
+        self._epoch = next(Database._epochs)
 
     def remove_relationship(self, relationship: 'Relationship') -> None:
         """Removes a relationship from the database."""
         if relationship.type is None:
             raise ValueError("Relationship type is null")
-        type_map = Database._relationships.get(relationship.type)
+        type_map = self._relationships.get(relationship.type)
         if type_map is None:
             return
         key = Database._endpoint_key(
@@ -133,13 +149,14 @@ class Database:
         )
         type_map.pop(key, None)
         if not type_map:
-            Database._relationships.pop(relationship.type, None)
+            self._relationships.pop(relationship.type, None)
+        self._epoch = next(Database._epochs)
 
     def refresh_relationship(self, relationship: 'Relationship') -> None:
         """Invalidates the cache of a STATIC virtual relationship."""
         if relationship.type is None:
             raise ValueError("Relationship type is null")
-        type_map = Database._relationships.get(relationship.type)
+        type_map = self._relationships.get(relationship.type)
         key = Database._endpoint_key(
             relationship.source.label if relationship.source else None,
             relationship.target.label if relationship.target else None,
@@ -156,7 +173,15 @@ class Database:
 
     def get_relationship(self, relationship: 'Relationship') -> Optional['PhysicalRelationship']:
         """Gets a relationship from the database (null labels act as wildcards)."""
-        type_map = Database._relationships.get(relationship.type) if relationship.type else None
+        if getattr(relationship, "_physical_epoch", -1) == self._epoch:
+            return relationship._physical_cache
+        physical = self._lookup_relationship(relationship)
+        relationship._physical_cache = physical
+        relationship._physical_epoch = self._epoch
+        return physical
+
+    def _lookup_relationship(self, relationship: 'Relationship') -> Optional['PhysicalRelationship']:
+        type_map = self._relationships.get(relationship.type) if relationship.type else None
         if not type_map:
             return None
         src = relationship.source.label if relationship.source else None
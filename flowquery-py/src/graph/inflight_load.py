@@ -0,0 +1,50 @@
+"""Sharing of in-progress virtual data loads between concurrent callers."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+Records = List[Dict[str, Any]]
+
+
+class InflightLoad:
+    """Shares one in-progress load between concurrent callers.
+
+    While a load is running, callers from other tasks await its result
+    instead of executing the statement again.  Calls made from the task
+    that is running the load (nested sub-queries) are not shared, so a
+    self-referencing statement cannot wait on itself.
+    """
+
+    __slots__ = ("_future", "_owner")
+
+    def __init__(self) -> None:
+        self._future: Optional[asyncio.Future[Records]] = None
+        self._owner: Optional[asyncio.Task[Any]] = None
+
+    async def run(self, load: Callable[[], Awaitable[Records]]) -> Records:
+        current = asyncio.current_task()
+        future = self._future
+        if future is not None and self._owner is not current:
+            return await asyncio.shield(future)
+        if future is not None:
+            return await load()
+        future = asyncio.get_running_loop().create_future()
+        self._future = future
+        self._owner = current
+        try:
+            result = await load()
+        except Exception as error:
+            future.set_exception(error)
+            # Mark the exception retrieved; the caller re-raises it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._future = None
+            self._owner = None
+            if not future.done():
+                future.cancel()
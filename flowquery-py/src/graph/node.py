@@ -9,6 +9,7 @@ from ..parsing.expressions.expression import Expression
 from .node_data import NodeData, NodeRecord
 
 if TYPE_CHECKING:
+    from .physical_node import PhysicalNode
     from .relationship import Relationship
 
 
@@ -29,6 +30,9 @@ class Node(ASTNode):
         self._incoming: Optional['Relationship'] = None
         self._outgoing: Optional['Relationship'] = None
         self._data: Optional['NodeData'] = None
+        # Memoized Database.get_node result, valid while the epoch matches
+        self._physical_cache: Optional['PhysicalNode'] = None
+        self._physical_epoch: int = -1
 
     @property
     def identifier(self) -> Optional[str]:
@@ -46,6 +50,7 @@ class Node(ASTNode):
     def label(self, value: Optional[str]) -> None:
         self._label = value
         self._labels = [value] if value is not None else []
+        self._physical_epoch = -1
 
     @property
     def labels(self) -> list[str]:
@@ -55,6 +60,7 @@ class Node(ASTNode):
     def labels(self, value: list[str]) -> None:
         self._labels = value
         self._label = value[0] if value else None
+        self._physical_epoch = -1
 
     @property
     def properties(self) -> Dict[str, Expression]:
@@ -76,10 +82,10 @@ class Node(ASTNode):
             return True
         if self._data is None:
             return True
+        record = self._data.current(hop)
+        if record is None:
+            raise ValueError("No current node data available")
         for key, expression in self._properties.items():
-            record = self._data.current(hop)
-            if record is None:
-                raise ValueError("No current node data available")
             if key not in record:
                 return False
             if record[key] != expression.value():
@@ -13,6 +13,8 @@ class NodeRecord(TypedDict, total=False):
 class NodeData(Data):
     """Node data class extending Data with ID-based indexing."""
 
+    __slots__ = ()
+
     def __init__(self, records: Optional[List[Dict[str, Any]]] = None):
         super().__init__(records)
         self._build_index("id")
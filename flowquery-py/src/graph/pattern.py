@@ -5,11 +5,10 @@ from __future__ import annotations
 from typing import Any, Generator, List, Optional, Sequence, Union
 
 from ..parsing.ast_node import ASTNode
+from ..parsing.functions.record_utils import PathValue
 from .data_resolver import DataResolver
 from .node import Node
-from .node_data import NodeData
 from .relationship import Relationship
-from .relationship_data import RelationshipData
 
 
 class Pattern(ASTNode):
@@ -77,7 +76,7 @@ class Pattern(ASTNode):
         return None
 
     def value(self) -> List[Any]:
-        return list(self.values())
+        return PathValue(self.values())
 
     def values(self) -> Generator[Any, None, None]:
         for i, element in enumerate(self._chain):
@@ -100,11 +99,10 @@ class Pattern(ASTNode):
             # Use type name comparison to avoid issues with module double-loading
             if type(element).__name__ in ('NodeReference', 'RelationshipReference'):
                 continue
-            data = await resolver.get_data(element)
-            if isinstance(element, Node) and isinstance(data, NodeData):
-                element.set_data(data)
-            elif isinstance(element, Relationship) and isinstance(data, RelationshipData):
-                element.set_data(data)
+            if isinstance(element, Node):
+                element.set_data(await resolver.get_node_data(element))
+            elif isinstance(element, Relationship):
+                element.set_data(await resolver.get_relationship_data(element))
 
     async def initialize(self) -> None:
         await self.fetch_data()
@@ -52,7 +52,9 @@ class PatternExpression(Pattern):
         """
         self._evaluation = False
         async for _ in self.start_node.next():
+            # One match decides the predicate; stop traversing
             self._evaluation = True
+            break
 
     def value(self) -> Any:
         """Returns the result of the pattern evaluation."""
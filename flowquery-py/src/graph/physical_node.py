@@ -6,6 +6,7 @@ import time
 from typing import Any, Dict, List, Optional
 
 from ..parsing.ast_node import ASTNode
+from .inflight_load import InflightLoad
 from .node import Node
 
 
@@ -22,6 +23,9 @@ class PhysicalNode(Node):
         self._refresh_every_ms: Optional[int] = None
         self._cache: Optional[List[Dict[str, Any]]] = None
         self._cached_at: float = 0.0
+        self._inflight: InflightLoad = InflightLoad()
+        self._sample_source: Optional[Dict[str, Any]] = None
+        self._sample: Dict[str, Any] = {}
 
     @property
     def physical_properties(self) -> Dict[str, Any]:
@@ -56,6 +60,20 @@ class PhysicalNode(Node):
     def invalidate_cache(self) -> None:
         self._cache = None
         self._cached_at = 0.0
+        self._sample_source = None
+        self._sample = {}
+
+    def schema_sample(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Project the first record without id for schema().
+
+        Memoized on the first record, so a cached STATIC result is
+        projected only once across schema() calls.
+        """
+        first = records[0]
+        if first is not self._sample_source:
+            self._sample = {k: v for k, v in first.items() if k != "id"}
+            self._sample_source = first
+        return self._sample
 
     async def data(
         self,
@@ -80,6 +98,16 @@ class PhysicalNode(Node):
             )
             if fresh:
                 return self._cache
+        if not provenance and args is None:
+            # Concurrent readers share a single execution of the statement
+            return await self._inflight.run(lambda: self._load(None, False))
+        return await self._load(args, provenance)
+
+    async def _load(
+        self,
+        args: Optional[Dict[str, Any]],
+        provenance: bool,
+    ) -> List[Dict[str, Any]]:
         # Import at runtime to avoid circular dependency
         from ..compute.runner import Runner, RunnerOptions
         runner = Runner(
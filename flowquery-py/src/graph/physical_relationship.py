@@ -6,7 +6,9 @@ import time
 from typing import Any, Dict, List, Optional
 
 from ..parsing.ast_node import ASTNode
+from .inflight_load import InflightLoad
 from .relationship import Relationship
+from .relationship_data import NON_PROPERTY_KEYS
 
 
 class PhysicalRelationship(Relationship):
@@ -19,6 +21,9 @@ class PhysicalRelationship(Relationship):
         self._refresh_every_ms: Optional[int] = None
         self._cache: Optional[List[Dict[str, Any]]] = None
         self._cached_at: float = 0.0
+        self._inflight: InflightLoad = InflightLoad()
+        self._sample_source: Optional[Dict[str, Any]] = None
+        self._sample: Dict[str, Any] = {}
 
     @property
     def statement(self) -> Optional[ASTNode]:
@@ -50,6 +55,22 @@ class PhysicalRelationship(Relationship):
     def invalidate_cache(self) -> None:
         self._cache = None
         self._cached_at = 0.0
+        self._sample_source = None
+        self._sample = {}
+
+    def schema_sample(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Project the first record without its id and type columns for schema().
+
+        Memoized on the first record, so a cached STATIC result is
+        projected only once across schema() calls.
+        """
+        first = records[0]
+        if first is not self._sample_source:
+            self._sample = {
+                k: v for k, v in first.items() if k not in NON_PROPERTY_KEYS
+            }
+            self._sample_source = first
+        return self._sample
 
     async def data(
         self,
@@ -71,6 +92,16 @@ class PhysicalRelationship(Relationship):
             )
             if fresh:
                 return self._cache
+        if not provenance and args is None:
+            # Concurrent readers share a single execution of the statement
+            return await self._inflight.run(lambda: self._load(None, False))
+        return await self._load(args, provenance)
+
+    async def _load(
+        self,
+        args: Optional[Dict[str, Any]],
+        provenance: bool,
+    ) -> List[Dict[str, Any]]:
         # Import at runtime to avoid circular dependency
         from ..compute.runner import Runner, RunnerOptions
         runner = Runner(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Union
 
 from ..parsing.ast_node import ASTNode
@@ -11,6 +12,7 @@ from .relationship_match_collector import RelationshipMatchCollector, Relationsh
 
 if TYPE_CHECKING:
     from .node import Node
+    from .physical_relationship import PhysicalRelationship
 
 
 class Relationship(ASTNode):
@@ -24,10 +26,16 @@ class Relationship(ASTNode):
         self._source: Optional['Node'] = None
         self._target: Optional['Node'] = None
         self._direction: str = "right"
+        # Derived from the direction once, for the traversal loop
+        self._is_left: bool = False
+        self._follow_id: str = "right_id"
         self._data: Optional['RelationshipData'] = None
         self._value: Optional[Union[RelationshipMatchRecord, List[RelationshipMatchRecord]]] = None
         self._matches: RelationshipMatchCollector = RelationshipMatchCollector()
         self._properties: Dict[str, Any] = {}
+        # Memoized Database.get_relationship result, valid while the epoch matches
+        self._physical_cache: Optional['PhysicalRelationship'] = None
+        self._physical_epoch: int = -1
 
     @property
     def identifier(self) -> Optional[str]:
@@ -43,7 +51,9 @@ class Relationship(ASTNode):
 
     @type.setter
     def type(self, value: str) -> None:
-        self._types = [value]
+        # Interned like the resolver's _type tags, for identity comparisons
+        self._types = [sys.intern(value)]
+        self._physical_epoch = -1
 
     @property
     def types(self) -> List[str]:
@@ -51,7 +61,8 @@ class Relationship(ASTNode):
 
     @types.setter
     def types(self, value: List[str]) -> None:
-        self._types = value
+        self._types = [sys.intern(t) for t in value]
+        self._physical_epoch = -1
 
     @property
     def hops(self) -> Hops:
@@ -75,10 +86,10 @@ class Relationship(ASTNode):
             return True
         if self._data is None:
             return True
+        record = self._data.current(hop)
+        if record is None:
+            raise ValueError("No current relationship data available")
         for key, expression in self._properties.items():
-            record = self._data.current(hop)
-            if record is None:
-                raise ValueError("No current relationship data available")
             if key not in record:
                 raise ValueError("Relationship does not have property")
             if record[key] != expression.value():
@@ -92,6 +103,7 @@ class Relationship(ASTNode):
     @source.setter
     def source(self, value: 'Node') -> None:
         self._source = value
+        self._physical_epoch = -1
 
     @property
     def target(self) -> Optional['Node']:
@@ -100,6 +112,7 @@ class Relationship(ASTNode):
     @target.setter
     def target(self, value: 'Node') -> None:
         self._target = value
+        self._physical_epoch = -1
 
     @property
     def direction(self) -> str:
@@ -108,6 +121,8 @@ class Relationship(ASTNode):
     @direction.setter
     def direction(self, value: str) -> None:
         self._direction = value
+        self._is_left = value == "left"
+        self._follow_id = "left_id" if self._is_left else "right_id"
 
     # Keep start/end aliases for backward compatibility
     @property
@@ -117,6 +132,7 @@ class Relationship(ASTNode):
     @start.setter
     def start(self, value: 'Node') -> None:
         self._source = value
+        self._physical_epoch = -1
 
     @property
     def end(self) -> Optional['Node']:
@@ -125,6 +141,7 @@ class Relationship(ASTNode):
     @end.setter
     def end(self, value: 'Node') -> None:
         self._target = value
+        self._physical_epoch = -1
 
     def set_data(self, data: Optional['RelationshipData']) -> None:
         self._data = data
@@ -132,9 +149,14 @@ class Relationship(ASTNode):
     def get_data(self) -> Optional['RelationshipData']:
         return self._data
 
-    def set_value(self, relationship: 'Relationship', traversal_id: str = "") -> None:
+    def set_value(
+        self,
+        relationship: 'Relationship',
+        traversal_id: str = "",
+        start: Optional['Node'] = None,
+    ) -> None:
         """Set value by pushing match to collector."""
-        self._matches.push(relationship, traversal_id)
+        self._matches.push(relationship, traversal_id, start)
         self._value = self._matches.value()
 
     def value(self) -> Optional[Union[RelationshipMatchRecord, List[RelationshipMatchRecord]]]:
@@ -148,52 +170,71 @@ class Relationship(ASTNode):
         """Set the end node for the current match."""
         self._matches.end_node = node
 
-    def _left_id_or_right_id(self) -> str:
-        return "left_id" if self._direction == "left" else "right_id"
-
     async def find(self, left_id: str, hop: int = 0) -> AsyncIterator[None]:
-        """Find relationships starting from the given node ID."""
-        # Save original source node
-        original = self._source
-        if hop > 0:
-            # For hops greater than 0, the source becomes the target of the previous hop
-            self._source = self._target
-        try:
-            if hop == 0:
-                if self._data:
-                    self._data.reset()
-
-                # Handle zero-hop case: when min is 0 on a variable-length relationship,
-                # match source node as target (no traversal)
-                if self._hops and self._hops.multi() and self._hops.min == 0 and self._target:
-                    # For zero-hop, target finds the same node as source (left_id)
-                    # No relationship match is pushed since no edge is traversed
-                    async for _ in self._target.find(left_id, hop):
-                        yield
-
-            while self._data and self._data.find(left_id, hop, self._direction):
-                data = self._data.current(hop)
-                if data is None:
+        """Find relationships starting from the given node ID.
+
+        Variable-length traversal is driven by an explicit stack of
+        ``(node_id, hop)`` frames rather than by recursing into ``find``,
+        so deeper hops do not allocate a new async generator each.  The
+        per-hop iteration state lives in the data layer for that hop.
+
+        Consumers may stop iterating after any match (e.g. a pattern
+        predicate): no state is restored on exit, and matches left behind
+        by an abandoned traversal are discarded on the next call.
+        """
+        self._matches.clear()
+        if hop == 0:
+            if self._data:
+                self._data.reset()
+
+            # Handle zero-hop case: when min is 0 on a variable-length relationship,
+            # match source node as target (no traversal)
+            if self._hops and self._hops.multi() and self._hops.min == 0 and self._target:
+                # For zero-hop, target finds the same node as source (left_id)
+                # No relationship match is pushed since no edge is traversed
+                async for _ in self._target.find(left_id, hop):
+                    yield
+
+        data = self._data
+        if data is None:
+            return
+        find_edge = data.find_incoming if self._is_left else data.find_outgoing
+        id_key = self._follow_id
+        min_hops = self._hops.min
+        max_hops = self._hops.max
+        matches = self._matches
+        # Hash-set membership on the ids of the current path
+        is_circular = matches.is_circular
+        stack: List[tuple[str, int]] = [(left_id, hop)]
+        while stack:
+            frame_id, frame_hop = stack[-1]
+            if not find_edge(frame_id, frame_hop):
+                stack.pop()
+                # A nested frame was entered after its parent pushed a match
+                if stack and frame_hop >= min_hops:
+                    matches.pop()
+                continue
+            record = data.current(frame_hop)
+            if record is None:
+                continue
+            id = record[id_key]
+            if frame_hop + 1 >= min_hops:
+                # For hops greater than 0, the source is the target of the previous hop
+                start = self._target if frame_hop > 0 else self._source
+                self.set_value(self, frame_id, start)
+                if not self._matches_properties(frame_hop):
+                    matches.pop()
                     continue
-                id = data[self._left_id_or_right_id()]
-                if hop + 1 >= self._hops.min:
-                    self.set_value(self, left_id)
-                    if not self._matches_properties(hop):
-                        continue
-                    if self._target:
-                        async for _ in self._target.find(id, hop):
-                            yield
-                    if hop + 1 < self._hops.max:
-                        if self._matches.is_circular(id):
-                            self._matches.pop()
-                            continue
-                        async for _ in self.find(id, hop + 1):
-                            yield
-                    self._matches.pop()
-                else:
-                    # Below minimum hops: traverse the edge without yielding a match
-                    async for _ in self.find(id, hop + 1):
+                if self._target:
+                    async for _ in self._target.find(id, frame_hop):
                         yield
-        finally:
-            # Restore original source node
-            self._source = original
+                if frame_hop + 1 < max_hops:
+                    if is_circular(id):
+                        matches.pop()
+                        continue
+                    stack.append((id, frame_hop + 1))
+                    continue
+                matches.pop()
+            else:
+                # Below minimum hops: traverse the edge without yielding a match
+                stack.append((id, frame_hop + 1))
@@ -4,6 +4,9 @@ from typing import Any, Dict, List, Optional, TypedDict
 
 from .data import Data
 
+# Record keys that locate or tag a relationship rather than describe it
+NON_PROPERTY_KEYS = frozenset(("left_id", "right_id", "_type"))
+
 
 class RelationshipRecord(TypedDict, total=False):
     """Represents a relationship record from the database."""
@@ -12,25 +15,35 @@ class RelationshipRecord(TypedDict, total=False):
 
 
 class RelationshipData(Data):
-    """Relationship data class extending Data with left_id and right_id indexing."""
+    """Relationship data class extending Data with left_id and right_id indexing.
+
+    The left_id and right_id indexes are the outgoing and incoming
+    adjacency of the relationship set in compressed-sparse-row form.
+    """
+
+    __slots__ = ()
 
     def __init__(self, records: Optional[List[Dict[str, Any]]] = None):
         super().__init__(records)
-        self._build_index("left_id")
-        self._build_index("right_id")
+        self._build_indexes(("left_id", "right_id"))
 
     def find(self, id: str, hop: int = 0, direction: str = "right") -> bool:
         """Find a relationship by node ID and direction."""
-        key = "right_id" if direction == "left" else "left_id"
-        return self._find(id, hop, key)
+        if direction == "left":
+            return self.find_incoming(id, hop)
+        return self.find_outgoing(id, hop)
+
+    def find_outgoing(self, id: str, hop: int = 0) -> bool:
+        """Find the next relationship whose left_id is the given node ID."""
+        return self._find(id, hop, "left_id")
+
+    def find_incoming(self, id: str, hop: int = 0) -> bool:
+        """Find the next relationship whose right_id is the given node ID."""
+        return self._find(id, hop, "right_id")
 
     def properties(self) -> Optional[Dict[str, Any]]:
         """Get properties of current relationship, excluding left_id, right_id, and _type."""
         current = self.current()
         if current:
-            props = dict(current)
-            props.pop("left_id", None)
-            props.pop("right_id", None)
-            props.pop("_type", None)
-            return props
+            return {k: v for k, v in current.items() if k not in NON_PROPERTY_KEYS}
         return None
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
+from .relationship_data import NON_PROPERTY_KEYS
+from .virtual_sources import attach_virtual_source, get_virtual_source
+
 if TYPE_CHECKING:
     from .node import Node
     from .relationship import Relationship
@@ -18,22 +21,41 @@ RelationshipMatchRecord = Dict[str, Any]
 class RelationshipMatchCollector:
     """Collects relationship matches during graph traversal."""
 
+    __slots__ = ("_matches", "_node_ids", "_node_id_counts")
+
     def __init__(self) -> None:
+        # Kept as a list of its own, rather than paired with the ids, because
+        # matches and value() hand this list to callers as the path
         self._matches: List[RelationshipMatchRecord] = []
+        # Traversal id of each match, parallel to _matches
         self._node_ids: List[str] = []
-        self._node_id_set: set[str] = set()
+        # Occurrences of each id on the current path.  A path can repeat
+        # an id (e.g. hops below the minimum are not cycle-checked), so a
+        # plain set would forget an id still present deeper in the path.
+        self._node_id_counts: Dict[str, int] = {}
+
+    def push(
+        self,
+        relationship: 'Relationship',
+        traversal_id: str = "",
+        start: Optional['Node'] = None,
+    ) -> RelationshipMatchRecord:
+        """Push a new match onto the collector.
 
-    def push(self, relationship: 'Relationship', traversal_id: str = "") -> RelationshipMatchRecord:
-        """Push a new match onto the collector."""
-        start_node_value = relationship.source.value() if relationship.source else None
+        ``start`` is the node the matched edge leaves from; it defaults
+        to the relationship's source.
+        """
+        start_node = start if start is not None else relationship.source
+        start_node_value = start_node.value() if start_node else None
         rel_data = relationship.get_data()
         current_record = rel_data.current() if rel_data else None
-        default_type = relationship.type or ""
-        if current_record and isinstance(current_record, dict):
-            actual_type = current_record.get('_type', default_type)
-        else:
-            actual_type = default_type
-        rel_props: Dict[str, Any] = (rel_data.properties() or {}) if rel_data else {}
+        actual_type = relationship.type or ""
+        rel_props: Dict[str, Any] = {}
+        if current_record:
+            actual_type = current_record.get('_type', actual_type)
+            rel_props = {
+                k: v for k, v in current_record.items() if k not in NON_PROPERTY_KEYS
+            }
         match: RelationshipMatchRecord = {
             **rel_props,
             "type": actual_type,
@@ -44,14 +66,13 @@ class RelationshipMatchCollector:
         # Thread inner virtual sub-query lineage through to the match
         # record so :class:`ProvenanceSites` can attach it to the hop.
         if current_record is not None:
-            from .virtual_sources import attach_virtual_source, get_virtual_source
-
             src = get_virtual_source(current_record)
             if src is not None:
                 attach_virtual_source(match, src)
         self._matches.append(match)
         self._node_ids.append(traversal_id)
-        self._node_id_set.add(traversal_id)
+        counts = self._node_id_counts
+        counts[traversal_id] = counts.get(traversal_id, 0) + 1
         return match
 
     @property
@@ -70,12 +91,23 @@ class RelationshipMatchCollector:
 
     def pop(self) -> Optional[RelationshipMatchRecord]:
         """Pop the last match from the collector."""
-        if self._node_ids:
-            removed_id = self._node_ids.pop()
-            self._node_id_set.discard(removed_id)
-        if self._matches:
-            return self._matches.pop()
-        return None
+        if not self._matches:
+            return None
+        # _matches and _node_ids are pushed together, so pop them together
+        removed_id = self._node_ids.pop()
+        counts = self._node_id_counts
+        remaining = counts[removed_id] - 1
+        if remaining:
+            counts[removed_id] = remaining
+        else:
+            del counts[removed_id]
+        return self._matches.pop()
+
+    def clear(self) -> None:
+        """Remove all matches."""
+        self._matches.clear()
+        self._node_ids.clear()
+        self._node_id_counts.clear()
 
     def value(self) -> Optional[Union[RelationshipMatchRecord, List[RelationshipMatchRecord]]]:
         """Get the current value(s)."""
@@ -93,4 +125,4 @@ class RelationshipMatchCollector:
 
     def is_circular(self, next_id: str = "") -> bool:
         """Check if traversing to the given node id would form a cycle."""
-        return next_id in self._node_id_set
+        return next_id in self._node_id_counts
@@ -2,6 +2,7 @@
 
 import argparse
 import asyncio
+from typing import Iterable, List
 
 from ..compute.runner import Runner
 
@@ -18,6 +19,9 @@ class CommandLine:
 
         # Or execute a single query:
         cli.execute("load json from 'https://example.com/data' as d return d")
+
+        # Or execute every statement in a script file:
+        cli.run_script("queries.fq")
     """
 
     def execute(self, query: str) -> None:
@@ -35,6 +39,42 @@ class CommandLine:
         except Exception as e:
             print(f"Error: {e}")
 
+    def run_script(self, path: str) -> None:
+        """Execute every statement in a script file and print each result.
+
+        Statements end with a line ending in ";", as in interactive mode,
+        and run in order on a single event loop.
+
+        Args:
+            path: Path of the script file.
+        """
+        with open(path, encoding="utf-8") as file:
+            statements = self._split_script(file.read())
+        event_loop = asyncio.new_event_loop()
+        try:
+            event_loop.run_until_complete(self._execute_many(statements))
+        finally:
+            event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+            event_loop.close()
+
+    @staticmethod
+    def _split_script(text: str) -> List[str]:
+        """Split script text into statements without their terminating ";"."""
+        statements: List[str] = []
+        lines: List[str] = []
+        for line in text.splitlines():
+            lines.append(line)
+            if line.strip().endswith(";"):
+                statement = "\n".join(lines).strip().rstrip(";")
+                if statement:
+                    statements.append(statement)
+                lines = []
+        # A final statement may omit its ";"
+        rest = "\n".join(lines).strip()
+        if rest:
+            statements.append(rest)
+        return statements
+
     def loop(self) -> None:
         """Starts the interactive command loop.
 
@@ -44,6 +84,16 @@ class CommandLine:
         print('Welcome to FlowQuery! Type "exit" to quit.')
         print('End queries with ";" to execute. Multi-line input supported.')
 
+        # One event loop for the whole session rather than one per statement
+        event_loop = asyncio.new_event_loop()
+        try:
+            self._repl(event_loop)
+        finally:
+            event_loop.run_until_complete(event_loop.shutdown_asyncgens())
+            event_loop.close()
+
+    def _repl(self, event_loop: asyncio.AbstractEventLoop) -> None:
+        """Read and execute statements until "exit" or end of input."""
         while True:
             try:
                 lines = []
@@ -69,7 +119,7 @@ class CommandLine:
 
             try:
                 runner = Runner(user_input)
-                asyncio.run(self._execute(runner))
+                event_loop.run_until_complete(self._execute(runner))
             except Exception as e:
                 print(f"Error: {e}")
 
@@ -79,6 +129,13 @@ class CommandLine:
         await runner.run()
         print(runner.results)
 
+    async def _execute_many(self, statements: Iterable[str]) -> None:
+        for statement in statements:
+            try:
+                await self._execute(Runner(statement))
+            except Exception as e:
+                print(f"Error: {e}")
+
 
 def main() -> None:
     """Entry point for the flowquery CLI command.
@@ -87,6 +144,8 @@ def main() -> None:
         flowquery              # Start interactive mode
         flowquery -c "query"   # Execute a single query
         flowquery --command "query"
+        flowquery -f script    # Execute every statement in a script file
+        flowquery --file script
     """
     parser = argparse.ArgumentParser(
         description="FlowQuery - A declarative query language for data processing pipelines",
@@ -98,11 +157,19 @@ def main() -> None:
         metavar="QUERY",
         help="Execute a FlowQuery statement and exit"
     )
+    parser.add_argument(
+        "-f", "--file",
+        type=str,
+        metavar="PATH",
+        help="Execute the statements in a script file and exit"
+    )
 
     args = parser.parse_args()
     cli = CommandLine()
 
     if args.command:
         cli.execute(args.command)
+    elif args.file:
+        cli.run_script(args.file)
     else:
         cli.loop()
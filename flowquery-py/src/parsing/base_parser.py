@@ -5,6 +5,10 @@ from typing import List, Optional
 from ..tokenization.token import Token
 from ..tokenization.tokenizer import Tokenizer
 
+# Returned whenever the parser looks past either end of the tokens.  The
+# parser only reads tokens, so a single instance is shared.
+_EOF = Token.EOF()
+
 
 class BaseParser:
     """Base class for parsers providing common token manipulation functionality.
@@ -69,7 +73,7 @@ class BaseParser:
             The current token, or EOF if at the end
         """
         if self._token_index >= len(self._tokens):
-            return Token.EOF()
+            return _EOF
         return self._tokens[self._token_index]
 
     @property
@@ -80,7 +84,7 @@ class BaseParser:
             The previous token, or EOF if at the beginning
         """
         if self._token_index - 1 < 0:
-            return Token.EOF()
+            return _EOF
         return self._tokens[self._token_index - 1]
 
     def next_significant_token(self, offset: int = 1) -> Token:
@@ -89,7 +93,7 @@ class BaseParser:
         while index < len(self._tokens) and self._tokens[index].is_whitespace_or_comment():
             index += 1
         if index >= len(self._tokens):
-            return Token.EOF()
+            return _EOF
         return self._tokens[index]
 
     def previous_significant_token(self, offset: int = 1) -> Token:
@@ -98,5 +102,5 @@ class BaseParser:
         while index >= 0 and self._tokens[index].is_whitespace_or_comment():
             index -= 1
         if index < 0:
-            return Token.EOF()
+            return _EOF
         return self._tokens[index]
@@ -31,10 +31,33 @@ class ListComprehension(ASTNode):
     def __init__(self) -> None:
         super().__init__()
         self._value_holder = ValueHolder()
+        # Child roles, resolved once the parser has finished adding children
+        self._resolved: bool = False
+        self._cached_array: Optional[ASTNode] = None
+        self._cached_where: Optional[Where] = None
+        self._cached_return: Optional[Expression] = None
 
     def introduces_scope(self) -> bool:
         return True
 
+    def _resolve(self) -> None:
+        """Resolve the child roles and bind the iteration variable once."""
+        if self._resolved:
+            return
+        children = self.get_children()
+        ref = children[0]
+        if hasattr(ref, "referred"):
+            ref.referred = self._value_holder
+        self._cached_array = children[1].first_child()
+        for child in children[2:]:
+            if isinstance(child, Where):
+                self._cached_where = child
+        if len(children) > 2:
+            last = children[-1]
+            if isinstance(last, Expression):
+                self._cached_return = last
+        self._resolved = True
+
     @property
     def reference(self) -> ASTNode:
         """The iteration variable reference."""
@@ -43,26 +66,21 @@ class ListComprehension(ASTNode):
     @property
     def array(self) -> ASTNode:
         """The source array expression (unwrapped from its Expression wrapper)."""
-        return self.get_children()[1].first_child()
+        self._resolve()
+        assert self._cached_array is not None
+        return self._cached_array
 
     @property
     def _return(self) -> Optional[Expression]:
         """The mapping expression, or None if not specified."""
-        children = self.get_children()
-        if len(children) <= 2:
-            return None
-        last = children[-1]
-        if isinstance(last, Where):
-            return None
-        return last if isinstance(last, Expression) else None
+        self._resolve()
+        return self._cached_return
 
     @property
     def where(self) -> Optional[Where]:
         """The optional WHERE filter condition."""
-        for child in self.get_children():
-            if isinstance(child, Where):
-                return child
-        return None
+        self._resolve()
+        return self._cached_where
 
     def value(self) -> List[Any]:
         """Evaluate the list comprehension.
@@ -73,20 +91,35 @@ class ListComprehension(ASTNode):
         Returns:
             The resulting filtered/mapped array.
         """
-        ref = self.reference
-        if hasattr(ref, "referred"):
-            ref.referred = self._value_holder
-        array = self.array.value()
+        self._resolve()
+        array = self._cached_array.value() if self._cached_array is not None else None
         if array is None or not isinstance(array, list):
             raise ValueError("Expected array for list comprehension")
+        where = self._cached_where
+        ret = self._cached_return
+        holder = self._value_holder
         result: List[Any] = []
+        append = result.append
+        if ret is None:
+            if where is None:
+                return list(array)
+            where_value = where.value
+            for item in array:
+                holder.holder = item
+                if where_value():
+                    append(item)
+            return result
+        ret_value = ret.value
+        if where is None:
+            for item in array:
+                holder.holder = item
+                append(ret_value())
+            return result
+        where_value = where.value
         for item in array:
-            self._value_holder.holder = item
-            if self.where is None or self.where.value():
-                if self._return is not None:
-                    result.append(self._return.value())
-                else:
-                    result.append(item)
+            holder.holder = item
+            if where_value():
+                append(ret_value())
         return result
 
     def __str__(self) -> str:
@@ -18,12 +18,11 @@ class ExpressionMap:
         return alias in self._map
 
     def set_map(self, expressions: List[Any]) -> None:
-        self._map.clear()
-        for expr in expressions:
-            alias = getattr(expr, 'alias', None)
-            if alias is None:
-                continue
-            self._map[alias] = expr
+        self._map = {
+            alias: expr
+            for expr in expressions
+            if (alias := getattr(expr, 'alias', None)) is not None
+        }
 
     def reset(self) -> None:
         for expr in self._map.values():
@@ -10,6 +10,8 @@ from .reducer_element import ReducerElement
 class AvgReducerElement(ReducerElement):
     """Reducer element for Avg aggregate function."""
 
+    __slots__ = ("_count", "_sum")
+
     def __init__(self) -> None:
         self._count: int = 0
         self._sum: Optional[float] = None
@@ -49,7 +51,7 @@ class Avg(AggregateFunction):
         self._expected_parameter_count = 1
 
     def reduce(self, element: AvgReducerElement) -> None:
-        element.value = self.first_child().value()
+        element.value = self.children[0].value()
 
     def element(self) -> AvgReducerElement:
         return AvgReducerElement()
@@ -29,15 +29,29 @@ class Coalesce(Function):
         self._expected_parameter_count = None  # variable number of parameters
 
     def value(self) -> Any:
-        children = self.get_children()
-        if len(children) == 0:
+        # The children list itself; get_children() would only add a call
+        children = self.children
+        if not children:
             raise ValueError("coalesce() requires at least one argument")
+        if len(children) == 2:
+            # The common coalesce(x, default) form, without the loop
+            first, second = children
+            try:
+                val = first.value()
+            except (KeyError, AttributeError):
+                val = None
+            if val is not None:
+                return val
+            try:
+                return second.value()
+            except (KeyError, AttributeError):
+                return None
         for child in children:
             try:
                 val = child.value()
             except (KeyError, AttributeError):
                 # Treat missing properties/keys as null
-                val = None
+                continue
             if val is not None:
                 return val
         return None
@@ -11,6 +11,8 @@ from .reducer_element import ReducerElement
 class CollectReducerElement(ReducerElement):
     """Reducer element for Collect aggregate function."""
 
+    __slots__ = ("_value",)
+
     def __init__(self) -> None:
         self._value: List[Any] = []
 
@@ -26,6 +28,8 @@ class CollectReducerElement(ReducerElement):
 class DistinctCollectReducerElement(ReducerElement):
     """Reducer element for Collect aggregate function with DISTINCT."""
 
+    __slots__ = ("_value",)
+
     def __init__(self) -> None:
         self._value: Dict[str, Any] = {}
 
@@ -61,7 +65,7 @@ class Collect(AggregateFunction):
         self._distinct: bool = False
 
     def reduce(self, element: CollectReducerElement) -> None:
-        element.value = self.first_child().value()
+        element.value = self.children[0].value()
 
     def element(self) -> Union[CollectReducerElement, DistinctCollectReducerElement]:
         return DistinctCollectReducerElement() if self._distinct else CollectReducerElement()
@@ -1,31 +1,39 @@
 """Count aggregate function."""
 
-import json
-from typing import Any, Union
+from typing import Any, Optional, Union
 
+from ...utils.object_utils import ObjectUtils
 from .aggregate_function import AggregateFunction
 from .function_metadata import FunctionDef
 from .reducer_element import ReducerElement
 
 
 class CountReducerElement(ReducerElement):
-    """Reducer element for Count aggregate function."""
+    """Reducer element for Count aggregate function.
+
+    ``Count.reduce`` increments ``count`` directly; assigning ``value``
+    counts one more value, for callers that use the generic protocol.
+    """
+
+    __slots__ = ("count",)
 
     def __init__(self) -> None:
-        self._value: int = 0
+        self.count: int = 0
 
     @property
     def value(self) -> Any:
-        return self._value
+        return self.count
 
     @value.setter
     def value(self, val: Any) -> None:
-        self._value += 1
+        self.count += 1
 
 
 class DistinctCountReducerElement(ReducerElement):
     """Reducer element for Count aggregate function with DISTINCT."""
 
+    __slots__ = ("_seen",)
+
     def __init__(self) -> None:
         self._seen: set[Any] = set()
 
@@ -35,8 +43,7 @@ class DistinctCountReducerElement(ReducerElement):
 
     @value.setter
     def value(self, val: Any) -> None:
-        key: str = json.dumps(val, sort_keys=True, default=str)
-        self._seen.add(key)
+        self._seen.add(ObjectUtils.hashable_key(val))
 
 
 @FunctionDef({
@@ -63,9 +70,39 @@ class Count(AggregateFunction):
         self._expected_parameter_count = 1
         self._supports_distinct = True
         self._distinct: bool = False
+        # Whether rows can be counted without evaluating the argument,
+        # resolved on the first reduce once the argument is final
+        self._skip_argument: Optional[bool] = None
+
+    def _argument_is_match_variable(self) -> bool:
+        """Check whether the argument is a bare MATCH node or relationship variable.
+
+        Such a reference only reads the bound record, so evaluating it can
+        neither fail nor affect the count.
+        """
+        # Lazy imports: expressions and the graph both import this package
+        from ...graph.node import Node
+        from ...graph.relationship import Relationship
+        from ..expressions.expression import Expression
+        from ..expressions.reference import Reference
+
+        argument = self.first_child()
+        if isinstance(argument, Expression) and argument.child_count() == 1:
+            argument = argument.first_child()
+        return isinstance(argument, Reference) and isinstance(
+            argument.referred, (Node, Relationship)
+        )
 
     def reduce(self, element: Union[CountReducerElement, DistinctCountReducerElement]) -> None:
-        element.value = self.first_child().value()
+        if isinstance(element, CountReducerElement):
+            skip = self._skip_argument
+            if skip is None:
+                skip = self._skip_argument = self._argument_is_match_variable()
+            if not skip:
+                self.children[0].value()
+            element.count += 1
+        else:
+            element.value = self.children[0].value()
 
     def element(self) -> Union[CountReducerElement, DistinctCountReducerElement]:
         return DistinctCountReducerElement() if self._distinct else CountReducerElement()
@@ -1,11 +1,10 @@
 """Date function."""
 
-from datetime import datetime
 from typing import Any
 
 from .function import Function
 from .function_metadata import FunctionDef
-from .temporal_utils import build_date_object, parse_temporal_arg
+from .temporal_utils import build_date_object, current_local_datetime, parse_temporal_arg
 
 
 @FunctionDef({
@@ -56,6 +55,6 @@ class DateFunction(Function):
         if len(children) == 1:
             d = parse_temporal_arg(children[0].value(), "date")
         else:
-            d = datetime.now()
+            d = current_local_datetime()
 
         return build_date_object(d)
@@ -1,11 +1,10 @@
 """Datetime function."""
 
-from datetime import datetime, timezone
 from typing import Any
 
 from .function import Function
 from .function_metadata import FunctionDef
-from .temporal_utils import build_datetime_object, parse_temporal_arg
+from .temporal_utils import build_utc_datetime_object, current_instant, parse_temporal_arg
 
 
 @FunctionDef({
@@ -57,6 +56,6 @@ class Datetime(Function):
         if len(children) == 1:
             d = parse_temporal_arg(children[0].value(), "datetime")
         else:
-            d = datetime.now(timezone.utc)
+            d = current_instant()
 
-        return build_datetime_object(d, utc=True)
+        return build_utc_datetime_object(d)
@@ -1,7 +1,7 @@
 """Duration function."""
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Tuple, cast
 
 from .function import Function
 from .function_metadata import FunctionDef
@@ -13,41 +13,58 @@ ISO_DURATION_REGEX = re.compile(
 )
 
 
-def _parse_duration_string(s: str) -> Dict[str, float]:
-    """Parse an ISO 8601 duration string into components."""
+_DURATION_COMPONENTS = ("years", "months", "weeks", "days", "hours", "minutes", "seconds")
+
+# Years, months, weeks, days, hours, minutes and seconds
+DurationComponents = Tuple[Any, Any, Any, Any, Any, Any, Any]
+
+
+def _parse_duration_string(s: str) -> DurationComponents:
+    """Parse an ISO 8601 duration string into components.
+
+    Returns years, months, weeks, days, hours, minutes and seconds,
+    in the order of ``_DURATION_COMPONENTS``.
+    """
     match = ISO_DURATION_REGEX.match(s)
     if not match:
         raise ValueError(f"duration(): Invalid ISO 8601 duration string: '{s}'")
-    return {
-        "years": float(match.group(1)) if match.group(1) else 0,
-        "months": float(match.group(2)) if match.group(2) else 0,
-        "weeks": float(match.group(3)) if match.group(3) else 0,
-        "days": float(match.group(4)) if match.group(4) else 0,
-        "hours": float(match.group(5)) if match.group(5) else 0,
-        "minutes": float(match.group(6)) if match.group(6) else 0,
-        "seconds": float(match.group(7)) if match.group(7) else 0,
-    }
-
-
-def _build_duration_object(components: Dict[str, Any]) -> Dict[str, Any]:
+    return cast(
+        DurationComponents,
+        tuple(float(group) if group else 0 for group in match.groups()),
+    )
+
+
+def _components_from_map(components: Dict[str, Any]) -> DurationComponents:
+    """Read the duration components of a map, in ``_DURATION_COMPONENTS`` order."""
+    get = components.get
+    return cast(
+        DurationComponents,
+        tuple(get(name, 0) or 0 for name in _DURATION_COMPONENTS),
+    )
+
+
+def _build_duration_object(
+    years: Any,
+    months: Any,
+    weeks: Any,
+    days: Any,
+    hours: Any,
+    minutes: Any,
+    raw_seconds: Any,
+    milliseconds_override: Any = None,
+    nanoseconds_override: Any = None,
+) -> Dict[str, Any]:
     """Build a duration result object from components."""
-    years = components.get("years", 0) or 0
-    months = components.get("months", 0) or 0
-    weeks = components.get("weeks", 0) or 0
-    days = components.get("days", 0) or 0
-    hours = components.get("hours", 0) or 0
-    minutes = components.get("minutes", 0) or 0
-    raw_seconds = components.get("seconds", 0) or 0
     seconds = int(raw_seconds)
     fractional_seconds = raw_seconds - seconds
 
-    if "milliseconds" in components and components["milliseconds"]:
-        milliseconds = int(components["milliseconds"])
+    if milliseconds_override:
+        milliseconds = int(milliseconds_override)
     else:
         milliseconds = round(fractional_seconds * 1000)
 
-    if "nanoseconds" in components and components["nanoseconds"]:
-        nanoseconds = int(components["nanoseconds"])
+    if nanoseconds_override:
+        nanoseconds = int(nanoseconds_override)
     else:
         nanoseconds = round(fractional_seconds * 1_000_000_000) % 1_000_000
 
@@ -61,30 +78,29 @@ def _build_duration_object(components: Dict[str, Any]) -> Dict[str, Any]:
     total_months = int(years * 12 + months)
 
     # Build ISO 8601 formatted string
-    formatted = "P"
+    parts = ["P"]
     if years:
-        formatted += f"{int(years)}Y"
+        parts.append(f"{int(years)}Y")
     if months:
-        formatted += f"{int(months)}M"
+        parts.append(f"{int(months)}M")
     if weeks:
-        formatted += f"{int(weeks)}W"
+        parts.append(f"{int(weeks)}W")
     raw_days = int(total_days - weeks * 7)
     if raw_days:
-        formatted += f"{raw_days}D"
+        parts.append(f"{raw_days}D")
     has_time = hours or minutes or seconds or milliseconds
     if has_time:
-        formatted += "T"
+        parts.append("T")
         if hours:
-            formatted += f"{int(hours)}H"
+            parts.append(f"{int(hours)}H")
         if minutes:
-            formatted += f"{int(minutes)}M"
+            parts.append(f"{int(minutes)}M")
         if seconds or milliseconds:
             if milliseconds:
-                formatted += f"{seconds}.{milliseconds:03d}S"
+                parts.append(f"{seconds}.{milliseconds:03d}S")
             else:
-                formatted += f"{seconds}S"
-    if formatted == "P":
-        formatted = "PT0S"
+                parts.append(f"{seconds}S")
+    formatted = "".join(parts) if len(parts) > 1 else "PT0S"
 
     return {
         "years": int(years),
@@ -145,15 +161,18 @@ class Duration(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        arg = self.get_children()[0].value()
+        arg = self.children[0].value()
         if arg is None:
             return None
 
         if isinstance(arg, str):
-            components = _parse_duration_string(arg)
-            return _build_duration_object(components)
+            return _build_duration_object(*_parse_duration_string(arg))
 
         if isinstance(arg, dict):
-            return _build_duration_object(arg)
+            return _build_duration_object(
+                *_components_from_map(arg),
+                milliseconds_override=arg.get("milliseconds"),
+                nanoseconds_override=arg.get("nanoseconds"),
+            )
 
         raise ValueError("duration() expects a string or map argument")
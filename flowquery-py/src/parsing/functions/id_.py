@@ -4,6 +4,7 @@ from typing import Any
 
 from .function import Function
 from .function_metadata import FunctionDef
+from .record_utils import is_relationship_record
 
 
 @FunctionDef({
@@ -32,14 +33,14 @@ class Id(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        obj = self.get_children()[0].value()
+        obj = self.children[0].value()
         if obj is None:
             return None
         if not isinstance(obj, dict):
             raise ValueError("id() expects a node or relationship")
 
         # If it's a RelationshipMatchRecord (has type, startNode, endNode, properties)
-        if all(k in obj for k in ("type", "startNode", "endNode", "properties")):
+        if is_relationship_record(obj):
             return obj["type"]
 
         # If it's a node record (has id field)
@@ -40,8 +40,8 @@ class Join(Function):
             self.add_child(node)
 
     def value(self) -> Any:
-        array = self.get_children()[0].value()
-        delimiter = self.get_children()[1].value()
+        array = self.children[0].value()
+        delimiter = self.children[1].value()
         if array is None:
             return None
         if not isinstance(array, list) or not isinstance(delimiter, str):
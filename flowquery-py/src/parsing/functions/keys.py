@@ -26,7 +26,7 @@ class Keys(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        obj = self.get_children()[0].value()
+        obj = self.children[0].value()
         if obj is None:
             return None
         if not isinstance(obj, dict):
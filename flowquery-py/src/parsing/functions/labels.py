@@ -29,7 +29,7 @@ class Labels(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        val = self.get_children()[0].value()
+        val = self.children[0].value()
         if val is None:
             return None
         if not isinstance(val, dict):
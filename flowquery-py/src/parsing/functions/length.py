@@ -4,6 +4,7 @@ from typing import Any
 
 from .function import Function
 from .function_metadata import FunctionDef
+from .record_utils import is_relationship_record
 
 
 @FunctionDef({
@@ -26,7 +27,7 @@ class Length(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        path = self.get_children()[0].value()
+        path = self.children[0].value()
         if path is None:
             return 0
         if not isinstance(path, list):
@@ -38,6 +39,6 @@ class Length(Function):
         for element in path:
             if element is None or not isinstance(element, dict):
                 continue
-            if all(k in element for k in ("type", "startNode", "endNode", "properties")):
+            if is_relationship_record(element):
                 count += 1
         return count
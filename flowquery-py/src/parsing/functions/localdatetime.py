@@ -1,11 +1,10 @@
 """Local datetime function."""
 
-from datetime import datetime
 from typing import Any
 
 from .function import Function
 from .function_metadata import FunctionDef
-from .temporal_utils import build_datetime_object, parse_temporal_arg
+from .temporal_utils import build_local_datetime_object, current_local_datetime, parse_temporal_arg
 
 
 @FunctionDef({
@@ -55,6 +54,6 @@ class LocalDatetime(Function):
         if len(children) == 1:
             d = parse_temporal_arg(children[0].value(), "localdatetime")
         else:
-            d = datetime.now()
+            d = current_local_datetime()
 
-        return build_datetime_object(d, utc=False)
+        return build_local_datetime_object(d)
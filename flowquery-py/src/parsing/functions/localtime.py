@@ -1,11 +1,10 @@
 """Local time function."""
 
-from datetime import datetime
 from typing import Any
 
 from .function import Function
 from .function_metadata import FunctionDef
-from .temporal_utils import build_time_object, parse_temporal_arg
+from .temporal_utils import build_local_time_object, current_local_datetime, parse_temporal_arg
 
 
 @FunctionDef({
@@ -52,6 +51,6 @@ class LocalTime(Function):
         if len(children) == 1:
             d = parse_temporal_arg(children[0].value(), "localtime")
         else:
-            d = datetime.now()
+            d = current_local_datetime()
 
-        return build_time_object(d, utc=False)
+        return build_local_time_object(d)
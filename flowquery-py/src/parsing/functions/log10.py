@@ -31,7 +31,7 @@ class Log10(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        val = self.get_children()[0].value()
+        val = self.children[0].value()
         if val is None:
             return None
         if not isinstance(val, (int, float)) or isinstance(val, bool):
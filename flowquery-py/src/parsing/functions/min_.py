@@ -8,19 +8,26 @@ from .reducer_element import ReducerElement
 
 
 class MinReducerElement(ReducerElement):
-    """Reducer element for Min aggregate function."""
+    """Reducer element for Min aggregate function.
+
+    ``Min.reduce`` compares against ``current`` directly; assigning
+    ``value`` does the same for callers that use the generic protocol.
+    """
+
+    __slots__ = ("current",)
 
     def __init__(self) -> None:
-        self._value: Any = None
+        # The smallest value seen so far
+        self.current: Any = None
 
     @property
     def value(self) -> Any:
-        return self._value
+        return self.current
 
     @value.setter
     def value(self, val: Any) -> None:
-        if self._value is None or val < self._value:
-            self._value = val
+        if self.current is None or val < self.current:
+            self.current = val
 
 
 @FunctionDef({
@@ -43,7 +50,10 @@ class Min(AggregateFunction):
         self._expected_parameter_count = 1
 
     def reduce(self, element: MinReducerElement) -> None:
-        element.value = self.first_child().value()
+        val = self.children[0].value()
+        current = element.current
+        if current is None or val < current:
+            element.current = val
 
     def element(self) -> MinReducerElement:
         return MinReducerElement()
@@ -4,6 +4,7 @@ from typing import Any, List
 
 from .function import Function
 from .function_metadata import FunctionDef
+from .record_utils import PathValue, is_relationship_record
 
 
 @FunctionDef({
@@ -29,11 +30,14 @@ class Nodes(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        path = self.get_children()[0].value()
+        path = self.children[0].value()
         if path is None:
             return []
         if not isinstance(path, list):
             raise ValueError("nodes() expects a path (array)")
+        if type(path) is PathValue:
+            # Nodes sit at the even positions; an unresolved end node is None
+            return [node for node in path[0::2] if node is not None]
         # A path is an array of alternating node and relationship objects:
         # [node, rel, node, rel, node, ...]
         # Nodes are plain dicts (have 'id' but not all of 'type'/'startNode'/'endNode'/'properties')
@@ -43,6 +47,6 @@ class Nodes(Function):
             if element is None or not isinstance(element, dict):
                 continue
             # A RelationshipMatchRecord has type, startNode, endNode, properties
-            if not all(k in element for k in ("type", "startNode", "endNode", "properties")):
+            if not is_relationship_record(element):
                 result.append(element)
         return result
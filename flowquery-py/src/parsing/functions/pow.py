@@ -32,8 +32,8 @@ class Pow(Function):
         self._expected_parameter_count = 2
 
     def value(self) -> Any:
-        base = self.get_children()[0].value()
-        exponent = self.get_children()[1].value()
+        base = self.children[0].value()
+        exponent = self.children[1].value()
         if base is None or exponent is None:
             return None
         if (
@@ -4,6 +4,7 @@ from typing import Any
 
 from .function import Function
 from .function_metadata import FunctionDef
+from .record_utils import is_relationship_record
 
 
 @FunctionDef({
@@ -32,19 +33,22 @@ class Properties(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        obj = self.get_children()[0].value()
+        obj = self.children[0].value()
         if obj is None:
             return None
         if not isinstance(obj, dict):
             raise ValueError("properties() expects a node, relationship, or map")
 
         # If it's a RelationshipMatchRecord (has type, startNode, endNode, properties)
-        if all(k in obj for k in ("type", "startNode", "endNode", "properties")):
+        if is_relationship_record(obj):
             return obj["properties"]
 
         # If it's a node record (has id field), exclude id and _label
         if "id" in obj:
-            return {k: v for k, v in obj.items() if k not in ("id", "_label")}
+            props = obj.copy()
+            del props["id"]
+            props.pop("_label", None)
+            return props
 
         # Otherwise, treat as a plain map and return a copy
         return dict(obj)
@@ -32,8 +32,8 @@ class Range(Function):
         self._expected_parameter_count = 2
 
     def value(self) -> Any:
-        start = self.get_children()[0].value()
-        end = self.get_children()[1].value()
+        start = self.children[0].value()
+        end = self.children[1].value()
         if start is None or end is None:
             return None
         if not isinstance(start, (int, float)) or not isinstance(end, (int, float)):
@@ -0,0 +1,26 @@
+"""Helpers for telling relationship match records apart from node records."""
+
+from typing import Any, Dict, List
+
+# Keys every RelationshipMatchRecord carries; node records lack at least one
+RELATIONSHIP_RECORD_KEYS = frozenset(("type", "startNode", "endNode", "properties"))
+
+
+def is_relationship_record(record: Dict[str, Any]) -> bool:
+    """Checks whether a record is a RelationshipMatchRecord.
+
+    A single subset test on the key view, rather than one membership
+    test per key.
+    """
+    return record.keys() >= RELATIONSHIP_RECORD_KEYS
+
+
+class PathValue(List[Any]):
+    """A path built by a MATCH pattern.
+
+    Node and relationship records alternate, starting and ending with a
+    node, so nodes() and relationships() can take every other element
+    instead of testing each one.  To every other consumer it is a list.
+    """
+
+    __slots__ = ()
@@ -4,7 +4,14 @@ from typing import Any
 
 
 class ReducerElement:
-    """Base class for reducer elements used in aggregate functions."""
+    """Base class for reducer elements used in aggregate functions.
+
+    One element is created per group and aggregate, so the built-in
+    elements declare ``__slots__``.  Subclasses that do not declare
+    their own still get an instance ``__dict__``.
+    """
+
+    __slots__ = ()
 
     @property
     def value(self) -> Any:
@@ -4,6 +4,7 @@ from typing import Any, List
 
 from .function import Function
 from .function_metadata import FunctionDef
+from .record_utils import PathValue, is_relationship_record
 
 
 @FunctionDef({
@@ -29,11 +30,14 @@ class Relationships(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        path = self.get_children()[0].value()
+        path = self.children[0].value()
         if path is None:
             return []
         if not isinstance(path, list):
             raise ValueError("relationships() expects a path (array)")
+        if type(path) is PathValue:
+            # Relationships sit at the odd positions
+            return path[1::2]
         # A path is an array of alternating node and relationship objects:
         # [node, rel, node, rel, node, ...]
         # Relationships are RelationshipMatchRecords (have 'type', 'startNode', 'endNode', 'properties')
@@ -41,6 +45,6 @@ class Relationships(Function):
         for element in path:
             if element is None or not isinstance(element, dict):
                 continue
-            if all(k in element for k in ("type", "startNode", "endNode", "properties")):
+            if is_relationship_record(element):
                 result.append(element)
         return result
@@ -29,9 +29,9 @@ class Replace(Function):
         self._expected_parameter_count = 3
 
     def value(self) -> Any:
-        text = self.get_children()[0].value()
-        pattern = self.get_children()[1].value()
-        replacement = self.get_children()[2].value()
+        text = self.children[0].value()
+        pattern = self.children[1].value()
+        replacement = self.children[2].value()
         if text is None:
             return None
         if not isinstance(text, str) or not isinstance(pattern, str) or not isinstance(replacement, str):
@@ -45,8 +45,8 @@ class Split(Function):
             self.add_child(node)
 
     def value(self) -> Any:
-        text = self.get_children()[0].value()
-        delimiter = self.get_children()[1].value()
+        text = self.children[0].value()
+        delimiter = self.children[1].value()
         if text is None:
             return None
         if not isinstance(text, str) or not isinstance(delimiter, str):
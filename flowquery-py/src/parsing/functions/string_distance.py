@@ -21,34 +21,56 @@ def _levenshtein_distance(a: str, b: str) -> float:
     Returns:
         The normalized Levenshtein distance (0 = identical, 1 = completely different)
     """
+    # Identical strings, including two empty ones
+    if a == b:
+        return 0.0
+
+    # Keep the shorter string along the rows; the distance is symmetric
+    if len(a) < len(b):
+        a, b = b, a
+    longest = len(a)
+
+    # A common prefix or suffix never needs an edit, so only the part
+    # between them goes through the matrix
+    start = 0
+    while start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a = longest
+    end_b = len(b)
+    while end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a = a[start:end_a]
+    b = b[start:end_b]
     m = len(a)
     n = len(b)
 
-    # Both empty strings are identical
-    if m == 0 and n == 0:
-        return 0.0
-
-    # Create a matrix of size (m+1) x (n+1)
-    dp = [[0] * (n + 1) for _ in range(m + 1)]
+    # Against an empty string every remaining character is one edit
+    if n == 0:
+        return m / longest
 
-    # Base cases: transforming empty string to/from a prefix
-    for i in range(m + 1):
-        dp[i][0] = i
-    for j in range(n + 1):
-        dp[0][j] = j
+    # Only the previous row of the matrix is needed to fill the next, so
+    # two rows are kept and swapped.  Row 0 is the distance from the empty
+    # prefix of a to each prefix of b.
+    above = list(range(n + 1))
+    row = [0] * (n + 1)
 
-    # Fill in the rest of the matrix
+    # The character of a is bound once per row, and min() is spelled out
+    # as comparisons, since a builtin call per cell dominates the loop.
     for i in range(1, m + 1):
+        char = a[i - 1]
+        row[0] = left = i
         for j in range(1, n + 1):
-            cost = 0 if a[i - 1] == b[j - 1] else 1
-            dp[i][j] = min(
-                dp[i - 1][j] + 1,       # deletion
-                dp[i][j - 1] + 1,       # insertion
-                dp[i - 1][j - 1] + cost  # substitution
-            )
+            best = above[j - 1] if char == b[j - 1] else above[j - 1] + 1  # substitution
+            if above[j] + 1 < best:
+                best = above[j] + 1  # deletion
+            if left + 1 < best:
+                best = left + 1  # insertion
+            row[j] = left = best
+        above, row = row, above
 
     # Normalize by the length of the longer string
-    return dp[m][n] / max(m, n)
+    return above[n] / longest
 
 
 @FunctionDef({
@@ -83,8 +105,8 @@ class StringDistance(Function):
         self._expected_parameter_count = 2
 
     def value(self) -> Optional[float]:
-        str1 = self.get_children()[0].value()
-        str2 = self.get_children()[1].value()
+        str1 = self.children[0].value()
+        str2 = self.children[1].value()
         if str1 is None or str2 is None:
             return None
         if not isinstance(str1, str) or not isinstance(str2, str):
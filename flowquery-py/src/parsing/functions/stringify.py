@@ -40,8 +40,8 @@ class Stringify(Function):
             self.add_child(node)
 
     def value(self) -> Any:
-        val = self.get_children()[0].value()
-        indent = int(self.get_children()[1].value())
+        val = self.children[0].value()
+        indent = int(self.children[1].value())
         if val is None:
             return None
         if not isinstance(val, (dict, list)):
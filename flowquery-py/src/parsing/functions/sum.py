@@ -10,6 +10,8 @@ from .reducer_element import ReducerElement
 class SumReducerElement(ReducerElement):
     """Reducer element for Sum aggregate function."""
 
+    __slots__ = ("_value",)
+
     def __init__(self) -> None:
         self._value: Any = None
 
@@ -45,7 +47,7 @@ class Sum(AggregateFunction):
         self._expected_parameter_count = 1
 
     def reduce(self, element: SumReducerElement) -> None:
-        element.value = self.first_child().value()
+        element.value = self.children[0].value()
 
     def element(self) -> SumReducerElement:
         return SumReducerElement()
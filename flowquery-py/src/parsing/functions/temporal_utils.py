@@ -4,8 +4,20 @@ These helpers are used by the datetime_, date_, time_, localdatetime,
 localtime, and timestamp functions.
 """
 
-from datetime import date, datetime, timezone
-from typing import Any, Dict
+import math
+from contextvars import ContextVar, Token
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MILLISECOND = timedelta(milliseconds=1)
+
+# The statement clock: a one-slot holder filled on the first read of "now"
+# while a statement runs, so every row of the statement sees one instant.
+_statement_clock: ContextVar[Optional[List[datetime]]] = ContextVar(
+    "statement_clock", default=None
+)
 
 
 def iso_day_of_week(d: date) -> int:
@@ -23,6 +35,58 @@ def quarter(month: int) -> int:
     return (month - 1) // 3 + 1
 
 
+def start_statement_clock() -> "Token[Optional[List[datetime]]]":
+    """Starts a statement clock for the current context.
+
+    Until the returned token is passed to :func:`stop_statement_clock`,
+    every no-argument temporal function reads the same instant, which
+    is taken lazily on first use.  A clock that is already running
+    (e.g. the outer statement of a sub-query) is kept.
+    """
+    clock = _statement_clock.get()
+    return _statement_clock.set(clock if clock is not None else [])
+
+
+def stop_statement_clock(token: "Token[Optional[List[datetime]]]") -> None:
+    """Restores the statement clock that was active before the matching start."""
+    _statement_clock.reset(token)
+
+
+def current_instant() -> datetime:
+    """Returns the current instant as an aware UTC datetime.
+
+    Inside a running statement this is the statement's single instant;
+    outside one it is read from the wall clock on every call.
+    """
+    clock = _statement_clock.get()
+    if clock is None:
+        return datetime.now(timezone.utc)
+    if not clock:
+        clock.append(datetime.now(timezone.utc))
+    return clock[0]
+
+
+def epoch_millis(d: datetime) -> int:
+    """Returns the milliseconds from the Unix epoch to an aware datetime.
+
+    Integer timedelta arithmetic, so the result is exact where scaling
+    the float ``timestamp()`` by 1000 can land one millisecond short.
+    """
+    return (d - _EPOCH) // _ONE_MILLISECOND
+
+
+def current_local_datetime() -> datetime:
+    """Returns :func:`current_instant` as a naive local datetime."""
+    return current_instant().astimezone().replace(tzinfo=None)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_string(text: str) -> datetime:
+    """Parses an ISO 8601 string, memoized since datetimes are immutable
+    and queries often parse the same literal for every row."""
+    return datetime.fromisoformat(text.replace("Z", "+00:00"))
+
+
 def parse_temporal_arg(arg: Any, fn_name: str) -> datetime:
     """Parses a temporal argument (string, number, or map) into a datetime object.
 
@@ -35,7 +99,7 @@ def parse_temporal_arg(arg: Any, fn_name: str) -> datetime:
     """
     if isinstance(arg, str):
         try:
-            return datetime.fromisoformat(arg.replace("Z", "+00:00"))
+            return _parse_iso_string(arg)
         except ValueError:
             raise ValueError(f"{fn_name}(): Invalid temporal string: '{arg}'")
 
@@ -64,6 +128,10 @@ def parse_temporal_arg(arg: Any, fn_name: str) -> datetime:
 def build_datetime_object(d: datetime, utc: bool) -> Dict[str, Any]:
     """Builds a datetime result object with full temporal properties.
 
+    Dispatches to :func:`build_utc_datetime_object` or
+    :func:`build_local_datetime_object`; callers that always want one of
+    them should call it directly.
+
     Args:
         d: The datetime object
         utc: If True, use UTC values; if False, use local values
@@ -73,34 +141,54 @@ def build_datetime_object(d: datetime, utc: bool) -> Dict[str, Any]:
         epochMillis, epochSeconds, dayOfWeek, dayOfYear, quarter, formatted
     """
     if utc:
-        if d.tzinfo is None:
-            d = d.replace(tzinfo=timezone.utc)
-        d_utc = d.astimezone(timezone.utc)
-        year = d_utc.year
-        month = d_utc.month
-        day = d_utc.day
-        hour = d_utc.hour
-        minute = d_utc.minute
-        second = d_utc.second
-        millisecond = d_utc.microsecond // 1000
-        formatted = d_utc.strftime("%Y-%m-%dT%H:%M:%S.") + f"{millisecond:03d}Z"
-    else:
-        if d.tzinfo is not None:
-            d = d.astimezone(tz=None).replace(tzinfo=None)
-        year = d.year
-        month = d.month
-        day = d.day
-        hour = d.hour
-        minute = d.minute
-        second = d.second
-        millisecond = d.microsecond // 1000
-        formatted = d.strftime("%Y-%m-%dT%H:%M:%S.") + f"{millisecond:03d}"
+        return build_utc_datetime_object(d)
+    return build_local_datetime_object(d)
 
-    date_part = date(year, month, day)
-    epoch_millis = int(d.timestamp() * 1000) if d.tzinfo else int(
-        datetime(year, month, day, hour, minute, second, millisecond * 1000).timestamp() * 1000
+
+def build_utc_datetime_object(d: datetime) -> Dict[str, Any]:
+    """Builds a datetime result object from UTC values.
+
+    A naive datetime is taken to be in UTC already.
+    """
+    if d.tzinfo is None:
+        d = d.replace(tzinfo=timezone.utc)
+    d_utc = d.astimezone(timezone.utc)
+    return _datetime_result(d_utc, epoch_millis(d_utc), "Z")
+
+
+def build_local_datetime_object(d: datetime) -> Dict[str, Any]:
+    """Builds a datetime result object from local values.
+
+    An aware datetime is converted to local time first.
+    """
+    if d.tzinfo is not None:
+        d = d.astimezone(tz=None).replace(tzinfo=None)
+    # Epoch millis of the local wall time, truncated to the millisecond.
+    # Whole seconds come from d itself and the milliseconds are added as
+    # integers, so no truncated copy of d has to be built.
+    epoch_millis = math.floor(d.timestamp()) * 1000 + d.microsecond // 1000
+    return _datetime_result(d, epoch_millis, "")
+
+
+def _datetime_result(d: datetime, epoch_millis: int, suffix: str) -> Dict[str, Any]:
+    """Builds the datetime result dict from ``d``'s components."""
+    year = d.year
+    month = d.month
+    day = d.day
+    hour = d.hour
+    minute = d.minute
+    second = d.second
+    millisecond = d.microsecond // 1000
+
+    # Formatted from the components already at hand; strftime would parse
+    # its format string and consult the locale on every call
+    formatted = (
+        f"{year}-{month:02d}-{day:02d}T{hour:02d}:{minute:02d}:{second:02d}"
+        f".{millisecond:03d}{suffix}"
     )
 
+    date_part = date(year, month, day)
+
     return {
         "year": year,
         "month": month,
@@ -151,6 +239,9 @@ def build_date_object(d: datetime) -> Dict[str, Any]:
 def build_time_object(d: datetime, utc: bool) -> Dict[str, Any]:
     """Builds a time result object (no date component).
 
+    Dispatches to :func:`build_utc_time_object` or
+    :func:`build_local_time_object`.
+
     Args:
         d: The datetime object
         utc: If True, use UTC values; if False, use local values
@@ -159,28 +250,34 @@ def build_time_object(d: datetime, utc: bool) -> Dict[str, Any]:
         A dict with hour, minute, second, millisecond, formatted
     """
     if utc:
-        if d.tzinfo is None:
-            d = d.replace(tzinfo=timezone.utc)
-        d_utc = d.astimezone(timezone.utc)
-        hour = d_utc.hour
-        minute = d_utc.minute
-        second = d_utc.second
-        millisecond = d_utc.microsecond // 1000
-    else:
-        if d.tzinfo is not None:
-            d = d.astimezone(tz=None).replace(tzinfo=None)
-        hour = d.hour
-        minute = d.minute
-        second = d.second
-        millisecond = d.microsecond // 1000
-
-    time_part = f"{hour:02d}:{minute:02d}:{second:02d}.{millisecond:03d}"
-    formatted = f"{time_part}Z" if utc else time_part
+        return build_utc_time_object(d)
+    return build_local_time_object(d)
+
 
+def build_utc_time_object(d: datetime) -> Dict[str, Any]:
+    """Builds a time result object from UTC values; naive input is taken as UTC."""
+    if d.tzinfo is not None:
+        d = d.astimezone(timezone.utc)
+    return _time_result(d, "Z")
+
+
+def build_local_time_object(d: datetime) -> Dict[str, Any]:
+    """Builds a time result object from local values; aware input is converted."""
+    if d.tzinfo is not None:
+        d = d.astimezone(tz=None)
+    return _time_result(d, "")
+
+
+def _time_result(d: datetime, suffix: str) -> Dict[str, Any]:
+    """Builds the time result dict from ``d``'s components."""
+    hour = d.hour
+    minute = d.minute
+    second = d.second
+    millisecond = d.microsecond // 1000
     return {
         "hour": hour,
         "minute": minute,
         "second": second,
         "millisecond": millisecond,
-        "formatted": formatted,
+        "formatted": f"{hour:02d}:{minute:02d}:{second:02d}.{millisecond:03d}{suffix}",
     }
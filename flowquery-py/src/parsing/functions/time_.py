@@ -1,11 +1,10 @@
 """Time function."""
 
-from datetime import datetime, timezone
 from typing import Any
 
 from .function import Function
 from .function_metadata import FunctionDef
-from .temporal_utils import build_time_object, parse_temporal_arg
+from .temporal_utils import build_utc_time_object, current_instant, parse_temporal_arg
 
 
 @FunctionDef({
@@ -52,6 +51,6 @@ class Time(Function):
         if len(children) == 1:
             d = parse_temporal_arg(children[0].value(), "time")
         else:
-            d = datetime.now(timezone.utc)
+            d = current_instant()
 
-        return build_time_object(d, utc=True)
+        return build_utc_time_object(d)
@@ -1,10 +1,10 @@
 """Timestamp function."""
 
-import time
 from typing import Any
 
 from .function import Function
 from .function_metadata import FunctionDef
+from .temporal_utils import current_instant, epoch_millis
 
 
 @FunctionDef({
@@ -34,4 +34,4 @@ class Timestamp(Function):
         self._expected_parameter_count = 0
 
     def value(self) -> Any:
-        return int(time.time() * 1000)
+        return epoch_millis(current_instant())
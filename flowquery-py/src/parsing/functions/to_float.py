@@ -1,11 +1,44 @@
 """ToFloat function."""
 
-from typing import Any
+from typing import Any, Callable, Dict
 
 from .function import Function
 from .function_metadata import FunctionDef
 
 
+def _float_from_bool(val: bool) -> float:
+    return 1.0 if val else 0.0
+
+
+def parse_float(val: str) -> float:
+    """Parse a string as a float, ignoring surrounding whitespace.
+
+    float() already skips the common whitespace, so most strings are
+    parsed without a stripped copy.  It rejects a few characters that
+    str.strip() removes (the ASCII separators \\x1c-\\x1f), so a failed
+    parse is retried on the stripped string.
+    """
+    try:
+        return float(val)
+    except ValueError:
+        return float(val.strip())
+
+
+def _float_from_string(val: str) -> float:
+    try:
+        return parse_float(val)
+    except (ValueError, OverflowError):
+        raise ValueError(f'Cannot convert string "{val}" to float')
+
+
+_CONVERTERS: Dict[type, Callable[[Any], float]] = {
+    float: float,
+    int: float,
+    bool: _float_from_bool,
+    str: _float_from_string,
+}
+
+
 @FunctionDef({
     "description": "Converts a value to a floating point number",
     "category": "scalar",
@@ -30,17 +63,17 @@ class ToFloat(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        val = self.get_children()[0].value()
+        val = self.children[0].value()
+        convert = _CONVERTERS.get(type(val))
+        if convert is not None:
+            return convert(val)
         if val is None:
             return None
+        # Subclasses of the supported types
         if isinstance(val, bool):
-            return 1.0 if val else 0.0
+            return _float_from_bool(val)
         if isinstance(val, (int, float)):
             return float(val)
         if isinstance(val, str):
-            trimmed = val.strip()
-            try:
-                return float(trimmed)
-            except (ValueError, OverflowError):
-                raise ValueError(f'Cannot convert string "{val}" to float')
+            return _float_from_string(val)
         raise ValueError("toFloat() expects a number, string, or boolean")
@@ -1,9 +1,29 @@
 """ToInteger function."""
 
-from typing import Any
+from typing import Any, Callable, Dict
 
 from .function import Function
 from .function_metadata import FunctionDef
+from .to_float import parse_float
+
+
+def _integer_from_bool(val: bool) -> int:
+    return 1 if val else 0
+
+
+def _integer_from_string(val: str) -> int:
+    try:
+        return int(parse_float(val))
+    except (ValueError, OverflowError):
+        raise ValueError(f'Cannot convert string "{val}" to integer')
+
+
+_CONVERTERS: Dict[type, Callable[[Any], int]] = {
+    int: int,
+    float: int,
+    bool: _integer_from_bool,
+    str: _integer_from_string,
+}
 
 
 @FunctionDef({
@@ -30,17 +50,17 @@ class ToInteger(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        val = self.get_children()[0].value()
+        val = self.children[0].value()
+        convert = _CONVERTERS.get(type(val))
+        if convert is not None:
+            return convert(val)
         if val is None:
             return None
+        # Subclasses of the supported types
         if isinstance(val, bool):
-            return 1 if val else 0
+            return _integer_from_bool(val)
         if isinstance(val, (int, float)):
             return int(val)
         if isinstance(val, str):
-            trimmed = val.strip()
-            try:
-                return int(float(trimmed))
-            except (ValueError, OverflowError):
-                raise ValueError(f'Cannot convert string "{val}" to integer')
+            return _integer_from_string(val)
         raise ValueError("toInteger() expects a number, string, or boolean")
@@ -27,7 +27,7 @@ class ToJson(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        text = self.get_children()[0].value()
+        text = self.children[0].value()
         if text is None:
             return None
         if not isinstance(text, str):
@@ -1,12 +1,27 @@
 """ToString function."""
 
 import json
-from typing import Any
+from typing import Any, Callable, Dict
 
 from .function import Function
 from .function_metadata import FunctionDef
 
 
+def _string_from_bool(val: bool) -> str:
+    return "true" if val else "false"
+
+
+# bool has its own entry so True becomes "true", not str()'s "True"
+_CONVERTERS: Dict[type, Callable[[Any], str]] = {
+    str: str,
+    int: str,
+    float: str,
+    bool: _string_from_bool,
+    dict: json.dumps,
+    list: json.dumps,
+}
+
+
 @FunctionDef({
     "description": "Converts a value to its string representation",
     "category": "scalar",
@@ -31,11 +46,15 @@ class ToString(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        val = self.get_children()[0].value()
+        val = self.children[0].value()
+        convert = _CONVERTERS.get(type(val))
+        if convert is not None:
+            return convert(val)
         if val is None:
             return None
+        # Subclasses of the types in the table, and any other value
         if isinstance(val, bool):
-            return str(val).lower()
+            return _string_from_bool(val)
         if isinstance(val, (dict, list)):
             return json.dumps(val)
         return str(val)
@@ -2,6 +2,7 @@
 
 from typing import Any
 
+from ...utils.string_utils import StringUtils
 from .function import Function
 from .function_metadata import FunctionDef
 
@@ -29,9 +30,9 @@ class Trim(Function):
         self._expected_parameter_count = 1
 
     def value(self) -> Any:
-        val = self.get_children()[0].value()
+        val = self.children[0].value()
         if val is None:
             return None
         if not isinstance(val, str):
             raise ValueError("Invalid argument for trim function: expected a string")
-        return val.strip()
+        return StringUtils.intern_short(val.strip())
@@ -45,16 +45,22 @@ class Call(Projection):
             raise ValueError("No function set for Call operation.")
 
         args = self._function.get_arguments()
+        # Loop-invariant lookups, bound once rather than per generated item
+        is_last = self.is_last
+        reset = self._map.reset
+        get = self._map.get
+        has = self._map.has
+        has_yield = self.has_yield
         async for item in self._function.generate(*args):
-            if not self.is_last:
-                self._map.reset()
+            if not is_last:
+                reset()
                 if isinstance(item, dict):
                     for key, value in item.items():
-                        expression = self._map.get(key)
+                        expression = get(key)
                         if expression:
                             expression.overridden = value
                 else:
-                    expression = self._map.get(DEFAULT_VARIABLE_NAME)
+                    expression = get(DEFAULT_VARIABLE_NAME)
                     if expression:
                         expression.overridden = item
                 if self.next:
@@ -63,7 +69,7 @@ class Call(Projection):
                 record: Dict[str, Any] = {}
                 if isinstance(item, dict):
                     for key, value in item.items():
-                        if self._map.has(key) or not self.has_yield:
+                        if not has_yield or has(key):
                             record[key] = value
                 else:
                     record[DEFAULT_VARIABLE_NAME] = item
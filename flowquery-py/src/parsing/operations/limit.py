@@ -23,11 +23,13 @@ class Limit(Operation):
         self._count += 1
 
     async def run(self) -> None:
-        if self._count >= self._limit:
+        count = self._count
+        if count >= self._limit:
             return
-        self._count += 1
-        if self.next:
-            await self.next.run()
+        self._count = count + 1
+        next_op = self.next
+        if next_op is not None:
+            await next_op.run()
 
     def reset(self) -> None:
         self._count = 0
@@ -4,8 +4,6 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import aiohttp
-
 from ...compute.provenance import (
     DataSourceBinding,
     ProvenanceSource,
@@ -140,6 +138,10 @@ class Load(Operation):
 
     async def _load_from_url(self) -> None:
         """Loads data from a URL source."""
+        # Imported on first use: aiohttp is most of the package's import
+        # time, and only LOAD from a URL needs it
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
             options = self._options()
             method = options.pop("method")
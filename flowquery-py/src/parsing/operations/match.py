@@ -46,14 +46,14 @@ class Match(Operation):
             if self.next:
                 await self.next.run()
 
-        # For OPTIONAL MATCH: if nothing matched, continue with None values
-        if not matched and self._optional:
+        # For OPTIONAL MATCH: if nothing matched, continue with None values.
+        # Without a downstream operation nothing would read them.
+        if not matched and self._optional and self.next is not None:
             for pattern in self._patterns.patterns:
                 for element in pattern.chain:
                     if isinstance(element, Node):
                         element.set_value(None)
-            if self.next:
-                await self.next.run()
+            await self.next.run()
 
     def _extract_where_predicates(self) -> None:
         """Extracts simple equality predicates from the immediately following WHERE clause
@@ -1,22 +1,40 @@
 """Represents an ORDER BY operation that sorts results."""
 
-import functools
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from .operation import Operation
 
 if TYPE_CHECKING:
+    from ..ast_node import ASTNode
     from ..expressions.expression import Expression
 
 
 class SortField:
     """A single sort specification: expression and direction."""
 
+    __slots__ = ("expression", "direction")
+
     def __init__(self, expression: 'Expression', direction: str = "asc"):
         self.expression = expression
         self.direction = direction
 
 
+class _Descending:
+    """Sort-key wrapper that inverts the ordering of the key it holds,
+    for descending fields in a sort with mixed directions."""
+
+    __slots__ = ("key",)
+
+    def __init__(self, key: Any):
+        self.key = key
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.key == other.key
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return bool(other.key < self.key)
+
+
 class OrderBy(Operation):
     """Represents an ORDER BY operation that sorts results.
 
@@ -37,16 +55,69 @@ class OrderBy(Operation):
         self._fields = fields
         self._results: List[Dict[str, Any]] = []
         self._sort_keys: List[List[Any]] = []
+        # (field index, identifier) of the fields that are bare references,
+        # resolved on first use; fields never change after parsing
+        self._fallback_columns: Optional[List[Tuple[int, str]]] = None
+        # Bound value() of each sort expression, bound on first capture
+        self._value_fns: Optional[List[Callable[[], Any]]] = None
+        # Expressions projected by the owning RETURN, and for each sort
+        # field the position of the one it merely references (or None)
+        self._projection: Optional[List['ASTNode']] = None
+        self._projected_positions: Optional[List[Optional[int]]] = None
 
     @property
     def fields(self) -> List[SortField]:
         return self._fields
 
-    def capture_sort_keys(self) -> None:
+    def bind_projection(self, expressions: List['ASTNode']) -> None:
+        """Register the expressions projected by the RETURN this ORDER BY
+        sorts, in projection order.  A sort field that is a bare reference
+        to one of them (``RETURN x * 2 AS y ORDER BY y``) then reuses the
+        projected value passed to :meth:`capture_sort_keys`."""
+        self._projection = expressions
+        self._projected_positions = None
+
+    def capture_sort_keys(self, projected_values: Optional[List[Any]] = None) -> None:
         """Evaluate every sort-field expression against the current runtime
         context and store the resulting values.  Must be called once per
-        accumulated row (from ``Return.run()``)."""
-        self._sort_keys.append([f.expression.value() for f in self._fields])
+        accumulated row (from ``Return.run()``).
+
+        Args:
+            projected_values: The row's projected values, in the order of
+                the expressions given to :meth:`bind_projection`
+        """
+        value_fns = self._value_fns
+        if value_fns is None:
+            value_fns = self._value_fns = [f.expression.value for f in self._fields]
+        if projected_values is None:
+            self._sort_keys.append([fn() for fn in value_fns])
+            return
+        positions = self._projected_positions
+        if positions is None:
+            positions = self._projected_positions = self._resolve_projected_positions()
+        self._sort_keys.append([
+            fn() if position is None else projected_values[position]
+            for fn, position in zip(value_fns, positions)
+        ])
+
+    def _resolve_projected_positions(self) -> List[Optional[int]]:
+        """For each sort field, the position of the projected expression it
+        is a bare reference to, or None when it must be evaluated."""
+        from ..expressions.reference import Reference
+
+        by_identity = {id(e): i for i, e in enumerate(self._projection or [])}
+        positions: List[Optional[int]] = []
+        for f in self._fields:
+            root = f.expression.first_child()
+            if (
+                isinstance(root, Reference)
+                and f.expression.child_count() == 1
+                and root.referred is not None
+            ):
+                positions.append(by_identity.get(id(root.referred)))
+            else:
+                positions.append(None)
+        return positions
 
     def sort(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Sort records using pre-computed sort keys captured during
@@ -62,51 +133,60 @@ class OrderBy(Operation):
         Useful for sorting a parallel array (e.g. row-level provenance)
         in lockstep with the result records.
         """
-        from ..expressions.reference import Reference
-
-        use_keys = len(self._sort_keys) == len(records)
-        keys = self._sort_keys
-
-        # Pre-compute fallback field names for when sort keys aren't
-        # available (aggregated returns).
-        fallback_fields: List[Optional[str]] = []
-        for f in self._fields:
-            root = f.expression.first_child()
-            if isinstance(root, Reference) and f.expression.child_count() == 1:
-                fallback_fields.append(root.identifier)
-            else:
-                fallback_fields.append(None)
-
+        # Each sort value becomes a (present, value) pair, so nulls sort
+        # first ascending (last descending) without ever being compared
+        # with a value, and Timsort compares whole key tuples in C rather
+        # than calling back into a Python comparator.
+        if len(self._sort_keys) == len(records):
+            columns = list(range(len(self._fields)))
+            rows: List[List[Any]] = self._sort_keys
+        else:
+            # No captured keys (aggregated returns): read the referenced
+            # fields out of each record, once per record
+            fallback = self._fallback()
+            columns = [i for i, _ in fallback]
+            names = [name for _, name in fallback]
+            rows = [[record.get(name) for name in names] for record in records]
         indices = list(range(len(records)))
-
-        def compare(ai: int, bi: int) -> int:
-            for f_idx, sf in enumerate(self._fields):
-                if use_keys:
-                    a_val = keys[ai][f_idx]
-                    b_val = keys[bi][f_idx]
-                elif fallback_fields[f_idx] is not None:
-                    a_val = records[ai].get(fallback_fields[f_idx])  # type: ignore[arg-type]
-                    b_val = records[bi].get(fallback_fields[f_idx])  # type: ignore[arg-type]
-                else:
-                    continue
-                cmp = 0
-                if a_val is None and b_val is None:
-                    cmp = 0
-                elif a_val is None:
-                    cmp = -1
-                elif b_val is None:
-                    cmp = 1
-                elif a_val < b_val:
-                    cmp = -1
-                elif a_val > b_val:
-                    cmp = 1
-                if cmp != 0:
-                    return -cmp if sf.direction == "desc" else cmp
-            return 0
-
-        indices.sort(key=functools.cmp_to_key(compare))
+        if not columns:
+            return indices
+
+        descending = [self._fields[i].direction == "desc" for i in columns]
+        if all(descending) or not any(descending):
+            # One direction for every field: reverse the whole sort, which
+            # Python keeps stable
+            positions = range(len(columns))
+            sort_keys = [
+                tuple((row[p] is not None, row[p]) for p in positions) for row in rows
+            ]
+            indices.sort(key=sort_keys.__getitem__, reverse=descending[0])
+        else:
+            mixed_keys = [
+                tuple(
+                    _Descending((row[p] is not None, row[p]))
+                    if desc
+                    else (row[p] is not None, row[p])
+                    for p, desc in enumerate(descending)
+                )
+                for row in rows
+            ]
+            indices.sort(key=mixed_keys.__getitem__)
         return indices
 
+    def _fallback(self) -> List[Tuple[int, str]]:
+        """The sort fields that are bare references, as (field index,
+        identifier) pairs, for sorting records without captured keys."""
+        if self._fallback_columns is None:
+            from ..expressions.reference import Reference
+
+            columns: List[Tuple[int, str]] = []
+            for i, f in enumerate(self._fields):
+                root = f.expression.first_child()
+                if isinstance(root, Reference) and f.expression.child_count() == 1:
+                    columns.append((i, root.identifier))
+            self._fallback_columns = columns
+        return self._fallback_columns
+
     async def run(self) -> None:
         """When used as a standalone operation, passes through to next."""
         if self.next:
@@ -115,6 +195,7 @@ class OrderBy(Operation):
     async def initialize(self) -> None:
         self._results = []
         self._sort_keys = []
+        self._value_fns = None
         if self.next:
             await self.next.initialize()
 
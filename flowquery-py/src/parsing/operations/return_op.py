@@ -17,6 +17,25 @@ from .projection import Projection
 if TYPE_CHECKING:
     from .where import Where
 
+_SHARED_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _clone_value(value: Any) -> Any:
+    """Deep-copies a projected value.
+
+    Query values are JSON-shaped, so plain dicts and lists are copied
+    directly and primitives are shared; anything else, subclasses of
+    dict and list included, goes through :func:`copy.deepcopy`.
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return {k: _clone_value(v) for k, v in value.items()}
+    if value_type is list:
+        return [_clone_value(v) for v in value]
+    if value_type in _SHARED_TYPES:
+        return value
+    return copy.deepcopy(value)
+
 
 class Return(Projection):
     """Represents a RETURN operation that produces the final query results.
@@ -63,6 +82,7 @@ class Return(Projection):
     @order_by.setter
     def order_by(self, order_by: OrderBy) -> None:
         self._order_by = order_by
+        order_by.bind_projection(self.children)
 
     def enable_provenance(self, sink: List[RowProvenance]) -> None:
         """Direct the runner-owned sink that receives the post-sorted,
@@ -91,13 +111,18 @@ class Return(Projection):
         if self._order_by is None and self._limit is not None and self._limit.is_limit_reached:
             return
         record: Dict[str, Any] = {}
+        # Raw projected values, handed to ORDER BY so sort fields that
+        # reference a projected alias are not evaluated a second time
+        projected: Optional[List[Any]] = [] if self._order_by is not None else None
         for expression, alias in self.expressions():
             if hasattr(expression, 'subqueries'):
                 for sq in expression.subqueries():
                     await sq.evaluate()
             raw = expression.value()
+            if projected is not None:
+                projected.append(raw)
             # Deep copy objects to preserve their state
-            value = copy.deepcopy(raw) if isinstance(raw, (dict, list)) else raw
+            value = _clone_value(raw) if isinstance(raw, (dict, list)) else raw
             # `_label` is an internal property attached to node records by
             # the data resolver (consumed by the labels() function).  Strip
             # it from the projected value so it doesn't leak into results.
@@ -106,7 +131,7 @@ class Return(Projection):
             record[alias] = value
         # Capture sort-key values while expression bindings are still live.
         if self._order_by is not None:
-            self._order_by.capture_sort_keys()
+            self._order_by.capture_sort_keys(projected)
         self._results.append(record)
         if self._provenance_sink is not None:
             segment = self._snapshot_provenance()
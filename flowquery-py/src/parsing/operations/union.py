@@ -1,9 +1,9 @@
 """Represents a UNION operation that combines results from two sub-queries."""
 
-import json
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...compute.provenance import RowProvenance
+from ...utils.object_utils import ObjectUtils
 from .operation import Operation
 
 
@@ -94,9 +94,8 @@ class Union(Operation):
 
         # Validate column names match
         if left_results and right_results:
-            left_keys = sorted(left_results[0].keys())
-            right_keys = sorted(right_results[0].keys())
-            if left_keys != right_keys:
+            # Key views compare as sets, so column order does not matter
+            if left_results[0].keys() != right_results[0].keys():
                 raise ValueError(
                     "All sub queries in a UNION must have the same return column names"
                 )
@@ -124,16 +123,20 @@ class Union(Operation):
         want_prov = self._provenance_sink is not None
         rows: List[Dict[str, Any]] = list(left)
         provenance: List[RowProvenance] = list(left_prov) if want_prov and left_prov is not None else []
-        seen: set[str] = set()
-        for row in left:
-            seen.add(json.dumps(row, sort_keys=True, default=str))
+        if not right:
+            # Left rows are kept as they are, so there is nothing to key
+            return rows, provenance
+        # Rows are told apart by content keys, equal exactly when their
+        # sorted JSON encodings would be, without encoding every row
+        row_key = ObjectUtils.hashable_key
+        seen = {row_key(row) for row in left}
         for i, row in enumerate(right):
-            serialized = json.dumps(row, sort_keys=True, default=str)
-            if serialized not in seen:
+            key = row_key(row)
+            if key not in seen:
                 rows.append(row)
                 if want_prov and right_prov is not None:
                     provenance.append(right_prov[i])
-                seen.add(serialized)
+                seen.add(key)
         return rows, provenance
 
     def _combine(
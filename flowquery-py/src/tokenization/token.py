@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Dict, Optional, Tuple
 
 from ..parsing.ast_node import ASTNode
 from ..utils.string_utils import StringUtils
@@ -11,6 +11,127 @@ from .operator import Operator
 from .symbol import Symbol
 from .token_type import TokenType
 
+# TokenToNode.convert, bound on the first Token.node access
+_convert_to_node: Optional[Callable[[Token], ASTNode]] = None
+
+# Token types, bound once so the checks below skip the enum class lookup
+_TYPE_BACKTICK_STRING = TokenType.BACKTICK_STRING
+_TYPE_BOOLEAN = TokenType.BOOLEAN
+_TYPE_COMMENT = TokenType.COMMENT
+_TYPE_EOF = TokenType.EOF
+_TYPE_F_STRING = TokenType.F_STRING
+_TYPE_IDENTIFIER = TokenType.IDENTIFIER
+_TYPE_KEYWORD = TokenType.KEYWORD
+_TYPE_NUMBER = TokenType.NUMBER
+_TYPE_OPERATOR = TokenType.OPERATOR
+_TYPE_STRING = TokenType.STRING
+_TYPE_SYMBOL = TokenType.SYMBOL
+_TYPE_UNARY_OPERATOR = TokenType.UNARY_OPERATOR
+_TYPE_WHITESPACE = TokenType.WHITESPACE
+
+_BOOLEAN_VALUES = frozenset(("TRUE", "FALSE"))
+
+# Checks that span several token types, worked out once per token
+_FLAG_BOOLEAN = 1
+_FLAG_OPERAND = 2
+_FLAG_TRIVIA = 4
+
+# Each (type, value) pair that an ``is_*`` check tests for gets a small
+# integer kind, looked up once per token, so the checks the parser makes
+# on every token are a single integer comparison.  Any other token is
+# _KIND_OTHER, except identifiers, which all share _KIND_IDENTIFIER.
+_KIND_OTHER = 0
+_KIND_IDENTIFIER = -1
+_KINDS: Dict[Tuple[TokenType, str], int] = {}
+
+
+def _kind(type_: TokenType, value: str) -> int:
+    kind = len(_KINDS) + 1
+    _KINDS[(type_, value)] = kind
+    return kind
+
+
+_KIND_LEFT_PARENTHESIS = _kind(TokenType.SYMBOL, Symbol.LEFT_PARENTHESIS.value)
+_KIND_RIGHT_PARENTHESIS = _kind(TokenType.SYMBOL, Symbol.RIGHT_PARENTHESIS.value)
+_KIND_COMMA = _kind(TokenType.SYMBOL, Symbol.COMMA.value)
+_KIND_DOT = _kind(TokenType.SYMBOL, Symbol.DOT.value)
+_KIND_COLON = _kind(TokenType.SYMBOL, Symbol.COLON.value)
+_KIND_OPENING_BRACE = _kind(TokenType.SYMBOL, Symbol.OPENING_BRACE.value)
+_KIND_CLOSING_BRACE = _kind(TokenType.SYMBOL, Symbol.CLOSING_BRACE.value)
+_KIND_OPENING_BRACKET = _kind(TokenType.SYMBOL, Symbol.OPENING_BRACKET.value)
+_KIND_CLOSING_BRACKET = _kind(TokenType.SYMBOL, Symbol.CLOSING_BRACKET.value)
+_KIND_SEMICOLON = _kind(TokenType.SYMBOL, Symbol.SEMICOLON.value)
+_KIND_ADD = _kind(TokenType.OPERATOR, Operator.ADD.value)
+_KIND_SUBTRACT = _kind(TokenType.OPERATOR, Operator.SUBTRACT.value)
+_KIND_MULTIPLY = _kind(TokenType.OPERATOR, Operator.MULTIPLY.value)
+_KIND_DIVIDE = _kind(TokenType.OPERATOR, Operator.DIVIDE.value)
+_KIND_EXPONENT = _kind(TokenType.OPERATOR, Operator.EXPONENT.value)
+_KIND_MODULO = _kind(TokenType.OPERATOR, Operator.MODULO.value)
+_KIND_EQUALS = _kind(TokenType.OPERATOR, Operator.EQUALS.value)
+_KIND_NOT_EQUALS = _kind(TokenType.OPERATOR, Operator.NOT_EQUALS.value)
+_KIND_LESS_THAN = _kind(TokenType.OPERATOR, Operator.LESS_THAN.value)
+_KIND_LESS_THAN_OR_EQUAL = _kind(TokenType.OPERATOR, Operator.LESS_THAN_OR_EQUAL.value)
+_KIND_GREATER_THAN = _kind(TokenType.OPERATOR, Operator.GREATER_THAN.value)
+_KIND_GREATER_THAN_OR_EQUAL = _kind(TokenType.OPERATOR, Operator.GREATER_THAN_OR_EQUAL.value)
+_KIND_AND = _kind(TokenType.OPERATOR, Operator.AND.value)
+_KIND_OR = _kind(TokenType.OPERATOR, Operator.OR.value)
+_KIND_NOT = _kind(TokenType.UNARY_OPERATOR, Operator.NOT.value)
+_KIND_IS = _kind(TokenType.OPERATOR, Operator.IS.value)
+_KIND_WITH = _kind(TokenType.KEYWORD, Keyword.WITH.value)
+_KIND_RETURN = _kind(TokenType.KEYWORD, Keyword.RETURN.value)
+_KIND_LOAD = _kind(TokenType.KEYWORD, Keyword.LOAD.value)
+_KIND_CALL = _kind(TokenType.KEYWORD, Keyword.CALL.value)
+_KIND_YIELD = _kind(TokenType.KEYWORD, Keyword.YIELD.value)
+_KIND_JSON = _kind(TokenType.KEYWORD, Keyword.JSON.value)
+_KIND_CSV = _kind(TokenType.KEYWORD, Keyword.CSV.value)
+_KIND_TEXT = _kind(TokenType.KEYWORD, Keyword.TEXT.value)
+_KIND_FROM = _kind(TokenType.KEYWORD, Keyword.FROM.value)
+_KIND_HEADERS = _kind(TokenType.KEYWORD, Keyword.HEADERS.value)
+_KIND_POST = _kind(TokenType.KEYWORD, Keyword.POST.value)
+_KIND_UNWIND = _kind(TokenType.KEYWORD, Keyword.UNWIND.value)
+_KIND_MATCH = _kind(TokenType.KEYWORD, Keyword.MATCH.value)
+_KIND_OPTIONAL = _kind(TokenType.KEYWORD, Keyword.OPTIONAL.value)
+_KIND_AS = _kind(TokenType.KEYWORD, Keyword.AS.value)
+_KIND_WHERE = _kind(TokenType.KEYWORD, Keyword.WHERE.value)
+_KIND_MERGE = _kind(TokenType.KEYWORD, Keyword.MERGE.value)
+_KIND_CREATE = _kind(TokenType.KEYWORD, Keyword.CREATE.value)
+_KIND_VIRTUAL = _kind(TokenType.KEYWORD, Keyword.VIRTUAL.value)
+_KIND_DELETE = _kind(TokenType.KEYWORD, Keyword.DELETE.value)
+_KIND_STATIC = _kind(TokenType.KEYWORD, Keyword.STATIC.value)
+_KIND_REFRESH = _kind(TokenType.KEYWORD, Keyword.REFRESH.value)
+_KIND_EVERY = _kind(TokenType.KEYWORD, Keyword.EVERY.value)
+_KIND_DROP = _kind(TokenType.KEYWORD, Keyword.DROP.value)
+_KIND_BINDING = _kind(TokenType.KEYWORD, Keyword.BINDING.value)
+_KIND_SET = _kind(TokenType.KEYWORD, Keyword.SET.value)
+_KIND_REMOVE = _kind(TokenType.KEYWORD, Keyword.REMOVE.value)
+_KIND_CASE = _kind(TokenType.KEYWORD, Keyword.CASE.value)
+_KIND_WHEN = _kind(TokenType.KEYWORD, Keyword.WHEN.value)
+_KIND_THEN = _kind(TokenType.KEYWORD, Keyword.THEN.value)
+_KIND_ELSE = _kind(TokenType.KEYWORD, Keyword.ELSE.value)
+_KIND_END = _kind(TokenType.KEYWORD, Keyword.END.value)
+_KIND_NULL = _kind(TokenType.KEYWORD, Keyword.NULL.value)
+_KIND_IN = _kind(TokenType.KEYWORD, Keyword.IN.value)
+_KIND_CONTAINS = _kind(TokenType.KEYWORD, Keyword.CONTAINS.value)
+_KIND_STARTS = _kind(TokenType.KEYWORD, Keyword.STARTS.value)
+_KIND_ENDS = _kind(TokenType.KEYWORD, Keyword.ENDS.value)
+_KIND_PIPE = _kind(TokenType.KEYWORD, Operator.PIPE.value)
+_KIND_DISTINCT = _kind(TokenType.KEYWORD, Keyword.DISTINCT.value)
+_KIND_LIMIT = _kind(TokenType.KEYWORD, Keyword.LIMIT.value)
+_KIND_UNION = _kind(TokenType.KEYWORD, Keyword.UNION.value)
+_KIND_ALL = _kind(TokenType.KEYWORD, Keyword.ALL.value)
+_KIND_ORDER = _kind(TokenType.KEYWORD, Keyword.ORDER.value)
+_KIND_BY = _kind(TokenType.KEYWORD, Keyword.BY.value)
+_KIND_ASC = _kind(TokenType.KEYWORD, Keyword.ASC.value)
+_KIND_DESC = _kind(TokenType.KEYWORD, Keyword.DESC.value)
+_KIND_EXISTS = _kind(TokenType.KEYWORD, Keyword.EXISTS.value)
+_KIND_LET = _kind(TokenType.KEYWORD, Keyword.LET.value)
+_KIND_UPDATE = _kind(TokenType.KEYWORD, Keyword.UPDATE.value)
+_KIND_ON = _kind(TokenType.KEYWORD, Keyword.ON.value)
+_KIND_MATCHED = _kind(TokenType.KEYWORD, Keyword.MATCHED.value)
+_KIND_INTO = _kind(TokenType.KEYWORD, Keyword.INTO.value)
+_KIND_USING = _kind(TokenType.KEYWORD, Keyword.USING.value)
+_KIND_INSERT = _kind(TokenType.KEYWORD, Keyword.INSERT.value)
+
 
 class Token:
     """Represents a single token in the FlowQuery language.
@@ -25,6 +146,17 @@ class Token:
         num_token = Token.NUMBER("42")
     """
 
+    __slots__ = (
+        "_position",
+        "_type",
+        "_value",
+        "_case_sensitive_value",
+        "_display_value",
+        "_kind",
+        "_flags",
+        "_can_be_identifier",
+    )
+
     def __init__(self, type_: TokenType, value: Optional[str] = None):
         """Creates a new Token instance.
 
@@ -36,7 +168,30 @@ class Token:
         self._type = type_
         self._value = value
         self._case_sensitive_value: Optional[str] = None
-        self._can_be_identifier = StringUtils.can_be_identifier(value or "")
+        # What the value property returns: the value as written when the
+        # tokenizer recorded it, else the canonical value
+        self._display_value = value
+        # Only keyword, operator and symbol tokens can have a value kind, so
+        # the other types skip the _KINDS lookup (which hashes the enum)
+        kind = _KIND_OTHER
+        flags = 0
+        if type_ == _TYPE_IDENTIFIER:
+            kind = _KIND_IDENTIFIER
+        elif type_ == _TYPE_NUMBER or type_ == _TYPE_STRING or type_ == _TYPE_BACKTICK_STRING:
+            flags = _FLAG_OPERAND
+        elif type_ == _TYPE_WHITESPACE or type_ == _TYPE_COMMENT:
+            flags = _FLAG_TRIVIA
+        elif type_ == _TYPE_BOOLEAN:
+            if value in _BOOLEAN_VALUES:
+                flags = _FLAG_BOOLEAN | _FLAG_OPERAND
+        elif value:
+            kind = _KINDS.get((type_, value), _KIND_OTHER)
+            if kind == _KIND_NULL:
+                flags = _FLAG_OPERAND
+        self._kind = kind
+        self._flags = flags
+        # Worked out on first use; only keyword and operator lookups ask
+        self._can_be_identifier: Optional[bool] = None
 
     def equals(self, other: Token) -> bool:
         """Checks if this token equals another token.
@@ -47,8 +202,12 @@ class Token:
         Returns:
             True if tokens are equal, False otherwise
         """
-        if self._type == TokenType.IDENTIFIER and other.type == TokenType.IDENTIFIER:
-            return True  # Identifier values are not compared
+        if self is other:
+            return True
+        kind = self._kind
+        if kind != _KIND_OTHER or other._kind != _KIND_OTHER:
+            # Identifiers share one kind, so their values are not compared
+            return kind == other._kind
         return self._type == other.type and self._value == other.value
 
     @property
@@ -65,7 +224,7 @@ class Token:
 
     @property
     def value(self) -> Optional[str]:
-        return self._case_sensitive_value or self._value
+        return self._display_value
 
     @property
     def case_sensitive_value(self) -> Optional[str]:
@@ -74,16 +233,30 @@ class Token:
     @case_sensitive_value.setter
     def case_sensitive_value(self, value: str) -> None:
         self._case_sensitive_value = value
+        self._display_value = value or self._value
 
     @property
     def can_be_identifier(self) -> bool:
-        return self._can_be_identifier
+        can_be_identifier = self._can_be_identifier
+        if can_be_identifier is None:
+            value = self._value
+            if not value:
+                can_be_identifier = False
+            else:
+                can_be_identifier = _CONSTANT_CAN_BE_IDENTIFIER.get(value)
+                if can_be_identifier is None:
+                    can_be_identifier = StringUtils.can_be_identifier(value)
+            self._can_be_identifier = can_be_identifier
+        return can_be_identifier
 
     @property
     def node(self) -> ASTNode:
-        # Import at runtime to avoid circular dependency
-        from ..parsing.token_to_node import TokenToNode
-        return TokenToNode.convert(self)
+        global _convert_to_node
+        if _convert_to_node is None:
+            # Import at runtime to avoid circular dependency
+            from ..parsing.token_to_node import TokenToNode
+            _convert_to_node = TokenToNode.convert
+        return _convert_to_node(self)
 
     def __str__(self) -> str:
         return f"{self._type.value} {self._value}"
@@ -95,7 +268,7 @@ class Token:
         return Token(TokenType.COMMENT, comment)
 
     def is_comment(self) -> bool:
-        return self._type == TokenType.COMMENT
+        return self._type == _TYPE_COMMENT
 
     # Identifier token
 
@@ -104,7 +277,7 @@ class Token:
         return Token(TokenType.IDENTIFIER, value)
 
     def is_identifier(self) -> bool:
-        return self._type == TokenType.IDENTIFIER or self._type == TokenType.BACKTICK_STRING
+        return self._type == _TYPE_IDENTIFIER or self._type == _TYPE_BACKTICK_STRING
 
     def is_keyword_that_cannot_be_identifier(self) -> bool:
         """Returns True for keywords that have special expression-level roles
@@ -128,28 +301,22 @@ class Token:
 
     @staticmethod
     def STRING(value: str, quote_char: str = '"') -> Token:
-        unquoted = StringUtils.unquote(value)
-        unescaped = StringUtils.remove_escaped_quotes(unquoted, quote_char)
-        return Token(TokenType.STRING, unescaped)
+        return Token(TokenType.STRING, StringUtils.unquote_and_unescape(value, quote_char))
 
     def is_string(self) -> bool:
-        return self._type == TokenType.STRING or self._type == TokenType.BACKTICK_STRING
+        return self._type == _TYPE_STRING or self._type == _TYPE_BACKTICK_STRING
 
     @staticmethod
     def BACKTICK_STRING(value: str, quote_char: str = '"') -> Token:
-        unquoted = StringUtils.unquote(value)
-        unescaped = StringUtils.remove_escaped_quotes(unquoted, quote_char)
-        return Token(TokenType.BACKTICK_STRING, unescaped)
+        return Token(TokenType.BACKTICK_STRING, StringUtils.unquote_and_unescape(value, quote_char))
 
     @staticmethod
     def F_STRING(value: str, quote_char: str = '"') -> Token:
-        unquoted = StringUtils.unquote(value)
-        unescaped = StringUtils.remove_escaped_quotes(unquoted, quote_char)
-        fstring = StringUtils.remove_escaped_braces(unescaped)
+        fstring = StringUtils.unquote_and_unescape(value, quote_char, remove_braces=True)
         return Token(TokenType.F_STRING, fstring)
 
     def is_f_string(self) -> bool:
-        return self._type == TokenType.F_STRING
+        return self._type == _TYPE_F_STRING
 
     # Number token
 
@@ -158,7 +325,7 @@ class Token:
         return Token(TokenType.NUMBER, value)
 
     def is_number(self) -> bool:
-        return self._type == TokenType.NUMBER
+        return self._type == _TYPE_NUMBER
 
     # Boolean token
 
@@ -167,7 +334,7 @@ class Token:
         return Token(TokenType.BOOLEAN, value)
 
     def is_boolean(self) -> bool:
-        return self._type == TokenType.BOOLEAN and self._value in ("TRUE", "FALSE")
+        return (self._flags & _FLAG_BOOLEAN) != 0
 
     # Symbol tokens
 
@@ -176,70 +343,70 @@ class Token:
         return Token(TokenType.SYMBOL, Symbol.LEFT_PARENTHESIS.value)
 
     def is_left_parenthesis(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.LEFT_PARENTHESIS.value
+        return self._kind == _KIND_LEFT_PARENTHESIS
 
     @staticmethod
     def RIGHT_PARENTHESIS() -> Token:
         return Token(TokenType.SYMBOL, Symbol.RIGHT_PARENTHESIS.value)
 
     def is_right_parenthesis(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.RIGHT_PARENTHESIS.value
+        return self._kind == _KIND_RIGHT_PARENTHESIS
 
     @staticmethod
     def COMMA() -> Token:
         return Token(TokenType.SYMBOL, Symbol.COMMA.value)
 
     def is_comma(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.COMMA.value
+        return self._kind == _KIND_COMMA
 
     @staticmethod
     def DOT() -> Token:
         return Token(TokenType.SYMBOL, Symbol.DOT.value)
 
     def is_dot(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.DOT.value
+        return self._kind == _KIND_DOT
 
     @staticmethod
     def COLON() -> Token:
         return Token(TokenType.SYMBOL, Symbol.COLON.value)
 
     def is_colon(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.COLON.value
+        return self._kind == _KIND_COLON
 
     @staticmethod
     def OPENING_BRACE() -> Token:
         return Token(TokenType.SYMBOL, Symbol.OPENING_BRACE.value)
 
     def is_opening_brace(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.OPENING_BRACE.value
+        return self._kind == _KIND_OPENING_BRACE
 
     @staticmethod
     def CLOSING_BRACE() -> Token:
         return Token(TokenType.SYMBOL, Symbol.CLOSING_BRACE.value)
 
     def is_closing_brace(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.CLOSING_BRACE.value
+        return self._kind == _KIND_CLOSING_BRACE
 
     @staticmethod
     def OPENING_BRACKET() -> Token:
         return Token(TokenType.SYMBOL, Symbol.OPENING_BRACKET.value)
 
     def is_opening_bracket(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.OPENING_BRACKET.value
+        return self._kind == _KIND_OPENING_BRACKET
 
     @staticmethod
     def CLOSING_BRACKET() -> Token:
         return Token(TokenType.SYMBOL, Symbol.CLOSING_BRACKET.value)
 
     def is_closing_bracket(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.CLOSING_BRACKET.value
+        return self._kind == _KIND_CLOSING_BRACKET
 
     @staticmethod
     def SEMICOLON() -> Token:
         return Token(TokenType.SYMBOL, Symbol.SEMICOLON.value)
 
     def is_semicolon(self) -> bool:
-        return self._type == TokenType.SYMBOL and self._value == Symbol.SEMICOLON.value
+        return self._kind == _KIND_SEMICOLON
 
     # Whitespace token
 
@@ -248,29 +415,29 @@ class Token:
         return Token(TokenType.WHITESPACE)
 
     def is_whitespace(self) -> bool:
-        return self._type == TokenType.WHITESPACE
+        return self._type == _TYPE_WHITESPACE
 
     # Operator tokens
 
     def is_operator(self) -> bool:
-        return self._type == TokenType.OPERATOR
+        return self._type == _TYPE_OPERATOR
 
     def is_unary_operator(self) -> bool:
-        return self._type == TokenType.UNARY_OPERATOR
+        return self._type == _TYPE_UNARY_OPERATOR
 
     @staticmethod
     def ADD() -> Token:
         return Token(TokenType.OPERATOR, Operator.ADD.value)
 
     def is_add(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.ADD.value
+        return self._kind == _KIND_ADD
 
     @staticmethod
     def SUBTRACT() -> Token:
         return Token(TokenType.OPERATOR, Operator.SUBTRACT.value)
 
     def is_subtract(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.SUBTRACT.value
+        return self._kind == _KIND_SUBTRACT
 
     def is_negation(self) -> bool:
         return self.is_subtract()
@@ -280,425 +447,425 @@ class Token:
         return Token(TokenType.OPERATOR, Operator.MULTIPLY.value)
 
     def is_multiply(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.MULTIPLY.value
+        return self._kind == _KIND_MULTIPLY
 
     @staticmethod
     def DIVIDE() -> Token:
         return Token(TokenType.OPERATOR, Operator.DIVIDE.value)
 
     def is_divide(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.DIVIDE.value
+        return self._kind == _KIND_DIVIDE
 
     @staticmethod
     def EXPONENT() -> Token:
         return Token(TokenType.OPERATOR, Operator.EXPONENT.value)
 
     def is_exponent(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.EXPONENT.value
+        return self._kind == _KIND_EXPONENT
 
     @staticmethod
     def MODULO() -> Token:
         return Token(TokenType.OPERATOR, Operator.MODULO.value)
 
     def is_modulo(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.MODULO.value
+        return self._kind == _KIND_MODULO
 
     @staticmethod
     def EQUALS() -> Token:
         return Token(TokenType.OPERATOR, Operator.EQUALS.value)
 
     def is_equals(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.EQUALS.value
+        return self._kind == _KIND_EQUALS
 
     @staticmethod
     def NOT_EQUALS() -> Token:
         return Token(TokenType.OPERATOR, Operator.NOT_EQUALS.value)
 
     def is_not_equals(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.NOT_EQUALS.value
+        return self._kind == _KIND_NOT_EQUALS
 
     @staticmethod
     def LESS_THAN() -> Token:
         return Token(TokenType.OPERATOR, Operator.LESS_THAN.value)
 
     def is_less_than(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.LESS_THAN.value
+        return self._kind == _KIND_LESS_THAN
 
     @staticmethod
     def LESS_THAN_OR_EQUAL() -> Token:
         return Token(TokenType.OPERATOR, Operator.LESS_THAN_OR_EQUAL.value)
 
     def is_less_than_or_equal(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.LESS_THAN_OR_EQUAL.value
+        return self._kind == _KIND_LESS_THAN_OR_EQUAL
 
     @staticmethod
     def GREATER_THAN() -> Token:
         return Token(TokenType.OPERATOR, Operator.GREATER_THAN.value)
 
     def is_greater_than(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.GREATER_THAN.value
+        return self._kind == _KIND_GREATER_THAN
 
     @staticmethod
     def GREATER_THAN_OR_EQUAL() -> Token:
         return Token(TokenType.OPERATOR, Operator.GREATER_THAN_OR_EQUAL.value)
 
     def is_greater_than_or_equal(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.GREATER_THAN_OR_EQUAL.value
+        return self._kind == _KIND_GREATER_THAN_OR_EQUAL
 
     @staticmethod
     def AND() -> Token:
         return Token(TokenType.OPERATOR, Operator.AND.value)
 
     def is_and(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.AND.value
+        return self._kind == _KIND_AND
 
     @staticmethod
     def OR() -> Token:
         return Token(TokenType.OPERATOR, Operator.OR.value)
 
     def is_or(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.OR.value
+        return self._kind == _KIND_OR
 
     @staticmethod
     def NOT() -> Token:
         return Token(TokenType.UNARY_OPERATOR, Operator.NOT.value)
 
     def is_not(self) -> bool:
-        return self._type == TokenType.UNARY_OPERATOR and self._value == Operator.NOT.value
+        return self._kind == _KIND_NOT
 
     @staticmethod
     def IS() -> Token:
         return Token(TokenType.OPERATOR, Operator.IS.value)
 
     def is_is(self) -> bool:
-        return self._type == TokenType.OPERATOR and self._value == Operator.IS.value
+        return self._kind == _KIND_IS
 
     # Keyword tokens
 
     def is_keyword(self) -> bool:
-        return self._type == TokenType.KEYWORD
+        return self._type == _TYPE_KEYWORD
 
     @staticmethod
     def WITH() -> Token:
         return Token(TokenType.KEYWORD, Keyword.WITH.value)
 
     def is_with(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.WITH.value
+        return self._kind == _KIND_WITH
 
     @staticmethod
     def RETURN() -> Token:
         return Token(TokenType.KEYWORD, Keyword.RETURN.value)
 
     def is_return(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.RETURN.value
+        return self._kind == _KIND_RETURN
 
     @staticmethod
     def LOAD() -> Token:
         return Token(TokenType.KEYWORD, Keyword.LOAD.value)
 
     def is_load(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.LOAD.value
+        return self._kind == _KIND_LOAD
 
     @staticmethod
     def CALL() -> Token:
         return Token(TokenType.KEYWORD, Keyword.CALL.value)
 
     def is_call(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.CALL.value
+        return self._kind == _KIND_CALL
 
     @staticmethod
     def YIELD() -> Token:
         return Token(TokenType.KEYWORD, Keyword.YIELD.value)
 
     def is_yield(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.YIELD.value
+        return self._kind == _KIND_YIELD
 
     @staticmethod
     def JSON() -> Token:
         return Token(TokenType.KEYWORD, Keyword.JSON.value)
 
     def is_json(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.JSON.value
+        return self._kind == _KIND_JSON
 
     @staticmethod
     def CSV() -> Token:
         return Token(TokenType.KEYWORD, Keyword.CSV.value)
 
     def is_csv(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.CSV.value
+        return self._kind == _KIND_CSV
 
     @staticmethod
     def TEXT() -> Token:
         return Token(TokenType.KEYWORD, Keyword.TEXT.value)
 
     def is_text(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.TEXT.value
+        return self._kind == _KIND_TEXT
 
     @staticmethod
     def FROM() -> Token:
         return Token(TokenType.KEYWORD, Keyword.FROM.value)
 
     def is_from(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.FROM.value
+        return self._kind == _KIND_FROM
 
     @staticmethod
     def HEADERS() -> Token:
         return Token(TokenType.KEYWORD, Keyword.HEADERS.value)
 
     def is_headers(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.HEADERS.value
+        return self._kind == _KIND_HEADERS
 
     @staticmethod
     def POST() -> Token:
         return Token(TokenType.KEYWORD, Keyword.POST.value)
 
     def is_post(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.POST.value
+        return self._kind == _KIND_POST
 
     @staticmethod
     def UNWIND() -> Token:
         return Token(TokenType.KEYWORD, Keyword.UNWIND.value)
 
     def is_unwind(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.UNWIND.value
+        return self._kind == _KIND_UNWIND
 
     @staticmethod
     def MATCH() -> Token:
         return Token(TokenType.KEYWORD, Keyword.MATCH.value)
 
     def is_match(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.MATCH.value
+        return self._kind == _KIND_MATCH
 
     @staticmethod
     def OPTIONAL() -> Token:
         return Token(TokenType.KEYWORD, Keyword.OPTIONAL.value)
 
     def is_optional(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.OPTIONAL.value
+        return self._kind == _KIND_OPTIONAL
 
     @staticmethod
     def AS() -> Token:
         return Token(TokenType.KEYWORD, Keyword.AS.value)
 
     def is_as(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.AS.value
+        return self._kind == _KIND_AS
 
     @staticmethod
     def WHERE() -> Token:
         return Token(TokenType.KEYWORD, Keyword.WHERE.value)
 
     def is_where(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.WHERE.value
+        return self._kind == _KIND_WHERE
 
     @staticmethod
     def MERGE() -> Token:
         return Token(TokenType.KEYWORD, Keyword.MERGE.value)
 
     def is_merge(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.MERGE.value
+        return self._kind == _KIND_MERGE
 
     @staticmethod
     def CREATE() -> Token:
         return Token(TokenType.KEYWORD, Keyword.CREATE.value)
 
     def is_create(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.CREATE.value
+        return self._kind == _KIND_CREATE
 
     @staticmethod
     def VIRTUAL() -> Token:
         return Token(TokenType.KEYWORD, Keyword.VIRTUAL.value)
 
     def is_virtual(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.VIRTUAL.value
+        return self._kind == _KIND_VIRTUAL
 
     @staticmethod
     def DELETE() -> Token:
         return Token(TokenType.KEYWORD, Keyword.DELETE.value)
 
     def is_delete(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.DELETE.value
+        return self._kind == _KIND_DELETE
 
     @staticmethod
     def STATIC() -> Token:
         return Token(TokenType.KEYWORD, Keyword.STATIC.value)
 
     def is_static(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.STATIC.value
+        return self._kind == _KIND_STATIC
 
     @staticmethod
     def REFRESH() -> Token:
         return Token(TokenType.KEYWORD, Keyword.REFRESH.value)
 
     def is_refresh(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.REFRESH.value
+        return self._kind == _KIND_REFRESH
 
     @staticmethod
     def EVERY() -> Token:
         return Token(TokenType.KEYWORD, Keyword.EVERY.value)
 
     def is_every(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.EVERY.value
+        return self._kind == _KIND_EVERY
 
     @staticmethod
     def DROP() -> Token:
         return Token(TokenType.KEYWORD, Keyword.DROP.value)
 
     def is_drop(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.DROP.value
+        return self._kind == _KIND_DROP
 
     @staticmethod
     def BINDING() -> Token:
         return Token(TokenType.KEYWORD, Keyword.BINDING.value)
 
     def is_binding(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.BINDING.value
+        return self._kind == _KIND_BINDING
 
     @staticmethod
     def SET() -> Token:
         return Token(TokenType.KEYWORD, Keyword.SET.value)
 
     def is_set(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.SET.value
+        return self._kind == _KIND_SET
 
     @staticmethod
     def REMOVE() -> Token:
         return Token(TokenType.KEYWORD, Keyword.REMOVE.value)
 
     def is_remove(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.REMOVE.value
+        return self._kind == _KIND_REMOVE
 
     @staticmethod
     def CASE() -> Token:
         return Token(TokenType.KEYWORD, Keyword.CASE.value)
 
     def is_case(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.CASE.value
+        return self._kind == _KIND_CASE
 
     @staticmethod
     def WHEN() -> Token:
         return Token(TokenType.KEYWORD, Keyword.WHEN.value)
 
     def is_when(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.WHEN.value
+        return self._kind == _KIND_WHEN
 
     @staticmethod
     def THEN() -> Token:
         return Token(TokenType.KEYWORD, Keyword.THEN.value)
 
     def is_then(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.THEN.value
+        return self._kind == _KIND_THEN
 
     @staticmethod
     def ELSE() -> Token:
         return Token(TokenType.KEYWORD, Keyword.ELSE.value)
 
     def is_else(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.ELSE.value
+        return self._kind == _KIND_ELSE
 
     @staticmethod
     def END() -> Token:
         return Token(TokenType.KEYWORD, Keyword.END.value)
 
     def is_end(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.END.value
+        return self._kind == _KIND_END
 
     @staticmethod
     def NULL() -> Token:
         return Token(TokenType.KEYWORD, Keyword.NULL.value)
 
     def is_null(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.NULL.value
+        return self._kind == _KIND_NULL
 
     @staticmethod
     def IN() -> Token:
         return Token(TokenType.KEYWORD, Keyword.IN.value)
 
     def is_in(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.IN.value
+        return self._kind == _KIND_IN
 
     @staticmethod
     def CONTAINS() -> Token:
         return Token(TokenType.KEYWORD, Keyword.CONTAINS.value)
 
     def is_contains(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.CONTAINS.value
+        return self._kind == _KIND_CONTAINS
 
     @staticmethod
     def STARTS() -> Token:
         return Token(TokenType.KEYWORD, Keyword.STARTS.value)
 
     def is_starts(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.STARTS.value
+        return self._kind == _KIND_STARTS
 
     @staticmethod
     def ENDS() -> Token:
         return Token(TokenType.KEYWORD, Keyword.ENDS.value)
 
     def is_ends(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.ENDS.value
+        return self._kind == _KIND_ENDS
 
     @staticmethod
     def PIPE() -> Token:
         return Token(TokenType.KEYWORD, Operator.PIPE.value)
 
     def is_pipe(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Operator.PIPE.value
+        return self._kind == _KIND_PIPE
 
     @staticmethod
     def DISTINCT() -> Token:
         return Token(TokenType.KEYWORD, Keyword.DISTINCT.value)
 
     def is_distinct(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.DISTINCT.value
+        return self._kind == _KIND_DISTINCT
 
     @staticmethod
     def LIMIT() -> Token:
         return Token(TokenType.KEYWORD, Keyword.LIMIT.value)
 
     def is_limit(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.LIMIT.value
+        return self._kind == _KIND_LIMIT
 
     @staticmethod
     def UNION() -> Token:
         return Token(TokenType.KEYWORD, Keyword.UNION.value)
 
     def is_union(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.UNION.value
+        return self._kind == _KIND_UNION
 
     @staticmethod
     def ALL() -> Token:
         return Token(TokenType.KEYWORD, Keyword.ALL.value)
 
     def is_all(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.ALL.value
+        return self._kind == _KIND_ALL
 
     @staticmethod
     def ORDER() -> Token:
         return Token(TokenType.KEYWORD, Keyword.ORDER.value)
 
     def is_order(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.ORDER.value
+        return self._kind == _KIND_ORDER
 
     @staticmethod
     def BY() -> Token:
         return Token(TokenType.KEYWORD, Keyword.BY.value)
 
     def is_by(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.BY.value
+        return self._kind == _KIND_BY
 
     @staticmethod
     def ASC() -> Token:
         return Token(TokenType.KEYWORD, Keyword.ASC.value)
 
     def is_asc(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.ASC.value
+        return self._kind == _KIND_ASC
 
     @staticmethod
     def DESC() -> Token:
         return Token(TokenType.KEYWORD, Keyword.DESC.value)
 
     def is_desc(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.DESC.value
+        return self._kind == _KIND_DESC
 
     # End of file token
 
@@ -707,7 +874,7 @@ class Token:
         return Token(TokenType.EOF)
 
     def is_eof(self) -> bool:
-        return self._type == TokenType.EOF
+        return self._type == _TYPE_EOF
 
     # Subquery expression tokens
 
@@ -716,7 +883,7 @@ class Token:
         return Token(TokenType.KEYWORD, Keyword.EXISTS.value)
 
     def is_exists(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.EXISTS.value
+        return self._kind == _KIND_EXISTS
 
     # LET / UPDATE bindings
 
@@ -725,71 +892,84 @@ class Token:
         return Token(TokenType.KEYWORD, Keyword.LET.value)
 
     def is_let(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.LET.value
+        return self._kind == _KIND_LET
 
     @staticmethod
     def UPDATE() -> Token:
         return Token(TokenType.KEYWORD, Keyword.UPDATE.value)
 
     def is_update(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.UPDATE.value
+        return self._kind == _KIND_UPDATE
 
     @staticmethod
     def ON() -> Token:
         return Token(TokenType.KEYWORD, Keyword.ON.value)
 
     def is_on(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.ON.value
+        return self._kind == _KIND_ON
 
     @staticmethod
     def MATCHED() -> Token:
         return Token(TokenType.KEYWORD, Keyword.MATCHED.value)
 
     def is_matched(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.MATCHED.value
+        return self._kind == _KIND_MATCHED
 
     @staticmethod
     def INTO() -> Token:
         return Token(TokenType.KEYWORD, Keyword.INTO.value)
 
     def is_into(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.INTO.value
+        return self._kind == _KIND_INTO
 
     @staticmethod
     def USING() -> Token:
         return Token(TokenType.KEYWORD, Keyword.USING.value)
 
     def is_using(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.USING.value
+        return self._kind == _KIND_USING
 
     @staticmethod
     def INSERT() -> Token:
         return Token(TokenType.KEYWORD, Keyword.INSERT.value)
 
     def is_insert(self) -> bool:
-        return self._type == TokenType.KEYWORD and self._value == Keyword.INSERT.value
+        return self._kind == _KIND_INSERT
 
     # Other utility methods
 
     def is_operand(self) -> bool:
-        return self.is_number() or self.is_boolean() or self.is_string() or self.is_null()
+        return (self._flags & _FLAG_OPERAND) != 0
 
     def is_whitespace_or_comment(self) -> bool:
-        return self.is_whitespace() or self.is_comment()
+        return (self._flags & _FLAG_TRIVIA) != 0
 
     def is_symbol(self) -> bool:
-        return self._type == TokenType.SYMBOL
+        return self._type == _TYPE_SYMBOL
 
     # Static class method lookup via string
     @staticmethod
     def method(name: str) -> Optional[Token]:
-        name_upper = name.upper()
-        if hasattr(Token, name_upper):
-            attr = getattr(Token, name_upper)
-            if callable(attr):
-                result = attr()
-                if isinstance(result, Token):
-                    return result
-            elif isinstance(attr, Token):
-                return attr
-        return None
+        factory = _FACTORIES.get(name.upper())
+        if factory is None:
+            return None
+        result = factory()
+        return result if isinstance(result, Token) else None
+
+
+# Keyword, operator and symbol values are fixed, so whether each can be an
+# identifier is worked out once here rather than on each mapper token the
+# tokenizer asks about.
+_CONSTANT_CAN_BE_IDENTIFIER = {
+    member.value: StringUtils.can_be_identifier(member.value)
+    for enum_class in (Keyword, Operator, Symbol)
+    for member in enum_class
+}
+
+
+# Token factories by name, for Token.method
+_FACTORIES: Dict[str, Callable[[], Token]] = {
+    name: getattr(Token, name)
+    for name, attr in vars(Token).items()
+    if name.isupper() and isinstance(attr, staticmethod)
+}
@@ -10,6 +10,11 @@ from .symbol import Symbol
 from .token import Token
 from .token_mapper import TokenMapper
 
+# Every run of whitespace is the same token.  It carries no value and the
+# parser only skips it, so one instance is shared and its position is not
+# tracked.
+_WHITESPACE = Token.WHITESPACE()
+
 
 class Tokenizer:
     """Tokenizes FlowQuery input strings into a sequence of tokens.
@@ -52,7 +57,8 @@ class Tokenizer:
             token = self._get_next_token(last)
             if token is None:
                 raise ValueError(f"Unrecognized token at position {self._walker.position}")
-            token.position = self._walker.position
+            if token is not _WHITESPACE:
+                token.position = self._walker.position
             tokens.append(token)
 
         return tokens
@@ -171,7 +177,7 @@ class Tokenizer:
         while not self._walker.is_at_end and self._walker.check_for_whitespace():
             self._walker.move_next()
             found_whitespace = True
-        return Token.WHITESPACE() if found_whitespace else None
+        return _WHITESPACE if found_whitespace else None
 
     def _number(self) -> Optional[Token]:
         start_position = self._walker.position
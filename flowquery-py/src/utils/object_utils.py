@@ -18,3 +18,33 @@ class ObjectUtils:
             True if the object is an instance of any class, False otherwise
         """
         return any(isinstance(obj, cls) for cls in classes)
+
+    @staticmethod
+    def hashable_key(value: Any) -> Any:
+        """Builds a hashable key that identifies a value by its content.
+
+        Two values get equal keys exactly when their sorted JSON encodings
+        would be equal, but without encoding anything: strings and integers
+        are their own key, lists become tuples and dicts become frozensets.
+        Booleans and floats are tagged so that ``1``, ``1.0`` and ``True``
+        stay distinct, as they are in JSON.
+
+        Args:
+            value: The value to build a key for
+
+        Returns:
+            A hashable key
+        """
+        value_type = type(value)
+        if value_type is str or value_type is int or value is None:
+            return value
+        if value_type is bool or value_type is float:
+            return (value_type, value)
+        if isinstance(value, dict):
+            return frozenset(
+                (str(k), ObjectUtils.hashable_key(v)) for k, v in value.items()
+            )
+        if isinstance(value, (list, tuple)):
+            return tuple(ObjectUtils.hashable_key(item) for item in value)
+        # Anything else is compared by its string form, as json's default=str
+        return str(value)
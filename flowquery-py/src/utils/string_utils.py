@@ -1,5 +1,7 @@
 """Utility class for string manipulation and validation."""
 
+import sys
+
 
 class StringUtils:
     """Utility class for string manipulation and validation.
@@ -13,6 +15,8 @@ class StringUtils:
     digits = '0123456789'
     whitespace = ' \t\n\r'
     word_valid_chars = letters + letters.upper() + digits + '_'
+    # Longest derived string that intern_short() will intern
+    intern_max_length = 32
 
     @staticmethod
     def unquote(s: str) -> str:
@@ -67,14 +71,11 @@ class StringUtils:
         Returns:
             The string with escape sequences removed
         """
-        unescaped = ''
-        i = 0
-        while i < len(s):
-            if i < len(s) - 1 and s[i] == '\\' and s[i + 1] == quote_char:
-                i += 1
-            unescaped += s[i]
-            i += 1
-        return unescaped
+        # A backslash-quote pair cannot overlap another, so replacing
+        # left to right matches a character-by-character scan
+        if '\\' not in s:
+            return s
+        return s.replace('\\' + quote_char, quote_char)
 
     @staticmethod
     def remove_escaped_braces(s: str) -> str:
@@ -86,13 +87,26 @@ class StringUtils:
         Returns:
             The string with escaped braces resolved
         """
-        unescaped = ''
-        i = 0
-        while i < len(s):
-            if i < len(s) - 1 and ((s[i] == '{' and s[i + 1] == '{') or (s[i] == '}' and s[i + 1] == '}')):
-                i += 1
-            unescaped += s[i]
-            i += 1
+        return s.replace('{{', '{').replace('}}', '}')
+
+    @staticmethod
+    def unquote_and_unescape(s: str, quote_char: str, remove_braces: bool = False) -> str:
+        """Unquotes a string literal and resolves its escapes.
+
+        Equivalent to unquote, then remove_escaped_quotes, then (for
+        f-strings) remove_escaped_braces.
+
+        Args:
+            s: The quoted string literal
+            quote_char: The quote character that may be escaped inside it
+            remove_braces: Whether to also resolve escaped braces
+
+        Returns:
+            The string's contents with escapes resolved
+        """
+        unescaped = StringUtils.remove_escaped_quotes(StringUtils.unquote(s), quote_char)
+        if remove_braces:
+            return StringUtils.remove_escaped_braces(unescaped)
         return unescaped
 
     @staticmethod
@@ -111,3 +125,22 @@ class StringUtils:
         if lower[0] not in StringUtils.letters and lower[0] != '_':
             return False
         return all(char in StringUtils.word_valid_chars for char in lower)
+
+    @staticmethod
+    def intern_short(s: str) -> str:
+        """Interns a string if it is short, and returns it unchanged otherwise.
+
+        Short derived strings (labels, statuses, categories) repeat across
+        many rows; interning shares one object per value, so later equality
+        tests and dict probes hit the identity check.  Long strings are left
+        alone so that large one-off values do not stay resident.
+
+        Args:
+            s: The string to intern
+
+        Returns:
+            The interned string, or ``s`` itself if it is too long
+        """
+        if len(s) <= StringUtils.intern_max_length:
+            return sys.intern(s)
+        return s
@@ -225,6 +225,20 @@ class TestRunner:
         assert len(results) == 1
         assert results[0] == {"cnt": 3}
 
+    @pytest.mark.asyncio
+    async def test_count_distinct_with_mixed_values(self):
+        """Test count distinct with maps, lists and values of different types."""
+        runner = Runner(
+            """
+            unwind [1, 1.0, true, "1", [1, 2], [1, 2], {a: 1, b: 2}, {b: 2, a: 1}, null] as v
+            return count(distinct v) as cnt
+            """
+        )
+        await runner.run()
+        results = runner.results
+        assert len(results) == 1
+        assert results[0] == {"cnt": 7}
+
     @pytest.mark.asyncio
     async def test_avg_with_null(self):
         """Test avg with null."""
@@ -451,6 +465,15 @@ class TestRunner:
         assert len(results) == 1
         assert results[0] == {"result": [11, 12, 13]}
 
+    @pytest.mark.asyncio
+    async def test_nested_list_comprehension_sees_outer_element(self):
+        """Test the outer element stays bound while an inner comprehension runs."""
+        runner = Runner(
+            "RETURN [x IN [1, 2, 3] WHERE x > 1 | [y IN [10, 20] WHERE y > x * 4 | x + y]] AS result"
+        )
+        await runner.run()
+        assert runner.results == [{"result": [[12, 22], [23]]}]
+
     @pytest.mark.asyncio
     async def test_list_comprehension_with_property_access(self):
         """Test list comprehension with property access."""
@@ -1610,6 +1633,47 @@ class TestRunner:
         assert len(results) == 1
         assert results[0] == {"r": []}
 
+    @pytest.mark.asyncio
+    async def test_nodes_and_relationships_of_multi_hop_path_after_with(self):
+        """Test nodes and relationships of a multi-hop path carried through WITH."""
+        await Runner(
+            """
+            CREATE VIRTUAL (:PyPathStop) AS {
+                UNWIND [{id: 1}, {id: 2}, {id: 3}] AS record
+                RETURN record.id AS id
+            }
+            """
+        ).run()
+        await Runner(
+            """
+            CREATE VIRTUAL (:PyPathStop)-[:PY_PATH_NEXT]-(:PyPathStop) AS {
+                UNWIND [{left_id: 1, right_id: 2}, {left_id: 2, right_id: 3}] AS record
+                RETURN record.left_id AS left_id, record.right_id AS right_id
+            }
+            """
+        ).run()
+        match = Runner(
+            """
+            MATCH p=(:PyPathStop {id: 1})-[:PY_PATH_NEXT*1..2]->(:PyPathStop {id: 3})
+            WITH p
+            RETURN [n IN nodes(p) | n.id] AS ids, size(relationships(p)) AS hops
+            """
+        )
+        await match.run()
+        assert match.results == [{"ids": [1, 2, 3], "hops": 2}]
+
+    @pytest.mark.asyncio
+    async def test_nodes_and_relationships_of_plain_list(self):
+        """Test nodes and relationships split a list that is not a matched path."""
+        runner = Runner(
+            """
+            WITH {id: 1} AS a, {type: 'R', startNode: {}, endNode: {}, properties: {}} AS r
+            RETURN size(nodes([r, a, null, a])) AS n, size(relationships([a, a, r])) AS rels
+            """
+        )
+        await runner.run()
+        assert runner.results == [{"n": 2, "rels": 1}]
+
     @pytest.mark.asyncio
     async def test_type_function(self):
         """Test type function."""
@@ -3814,6 +3878,23 @@ class TestRunner:
         assert len(results) == 1
         assert results == [{"x": 1}]
 
+    @pytest.mark.asyncio
+    async def test_union_removes_duplicate_maps_and_lists(self):
+        """Test UNION compares nested values by content and keeps 1, 1.0 and true apart."""
+        runner = Runner(
+            "UNWIND [{a: 1, b: [1, 2]}, 1, 1.0, true] AS x RETURN x "
+            "UNION "
+            "UNWIND [{b: [1, 2], a: 1}, {a: 1, b: [2, 1]}, true, 1] AS x RETURN x"
+        )
+        await runner.run()
+        assert runner.results == [
+            {"x": {"a": 1, "b": [1, 2]}},
+            {"x": 1},
+            {"x": 1.0},
+            {"x": True},
+            {"x": {"a": 1, "b": [2, 1]}},
+        ]
+
     @pytest.mark.asyncio
     async def test_union_all_keeps_duplicates(self):
         """Test UNION ALL keeps duplicates."""
@@ -4469,6 +4550,15 @@ class TestRunner:
         assert len(results) == 1
         assert results[0] == {"result": "Alice"}
 
+    @pytest.mark.asyncio
+    async def test_coalesce_two_arguments_both_null_or_missing(self):
+        """Test coalesce with two arguments when neither has a value."""
+        runner = Runner("RETURN coalesce(null, {a: 1}.b) as result")
+        await runner.run()
+        results = runner.results
+        assert len(results) == 1
+        assert results[0] == {"result": None}
+
     # ============================================================
     # Temporal / Time Functions
     # ============================================================
@@ -4633,6 +4723,15 @@ class TestRunner:
         assert isinstance(dt["hour"], int)
         assert dt["epochMillis"] is not None
 
+    @pytest.mark.asyncio
+    async def test_localdatetime_epoch_millis_keeps_milliseconds_exact(self):
+        """Test localdatetime() epochMillis is not thrown off by float rounding."""
+        runner = Runner("RETURN localdatetime('1987-02-07T14:09:44.999999') AS dt")
+        await runner.run()
+        dt = runner.results[0]["dt"]
+        assert dt["millisecond"] == 999
+        assert dt["epochMillis"] % 1000 == 999
+
     @pytest.mark.asyncio
     async def test_timestamp_returns_epoch_millis(self):
         """Test timestamp() returns epoch millis."""
@@ -4660,6 +4759,19 @@ class TestRunner:
         # They should be very close (within a few ms)
         assert abs(results[0]["dtMillis"] - results[0]["tsMillis"]) < 100
 
+    @pytest.mark.asyncio
+    async def test_current_time_is_fixed_for_the_statement(self):
+        """Test every row of a statement sees the same current instant."""
+        runner = Runner(
+            "UNWIND range(1, 500) AS x "
+            "RETURN timestamp() AS ts, datetime().epochMillis AS dtMillis"
+        )
+        await runner.run()
+        results = runner.results
+        assert len(results) == 500
+        assert len({(r["ts"], r["dtMillis"]) for r in results}) == 1
+        assert results[0]["ts"] == results[0]["dtMillis"]
+
     @pytest.mark.asyncio
     async def test_date_with_property_access_in_where(self):
         """Test date() with property access in WHERE."""
@@ -4933,6 +5045,23 @@ class TestRunner:
         await runner.run()
         assert runner.results[0] == {"f": 3.14}
 
+    @pytest.mark.asyncio
+    async def test_tofloat_and_tointeger_with_padded_string(self):
+        """Test toFloat() and toInteger() ignore surrounding whitespace."""
+        runner = Runner("RETURN toFloat('  3.5 ') AS f, toInteger('\t42 ') AS i")
+        await runner.run()
+        assert runner.results[0] == {"f": 3.5, "i": 42}
+
+    @pytest.mark.asyncio
+    async def test_tofloat_and_tointeger_strip_what_str_strip_strips(self):
+        """Test toFloat() and toInteger() accept whitespace float() alone rejects."""
+        runner = Runner(
+            "RETURN toInteger(' 7 ') AS i, toFloat('\t1.5\n') AS f, "
+            "toFloat('\x1c2.5\x1f') AS g, toInteger('\x1d8') AS j"
+        )
+        await runner.run()
+        assert runner.results[0] == {"i": 7, "f": 1.5, "g": 2.5, "j": 8}
+
     @pytest.mark.asyncio
     async def test_tofloat_function_with_integer(self):
         """Test toFloat() function with integer."""
@@ -5058,6 +5187,25 @@ class TestRunner:
         assert results[1] == {"name": "Alice", "age": 30}
         assert results[2] == {"name": "Bob", "age": 25}
 
+    @pytest.mark.asyncio
+    async def test_order_by_projected_alias_sorts_by_projected_value(self):
+        """Test ORDER BY on a projected alias sorts by the value that was returned."""
+        runner = Runner("unwind range(1, 50) as x return rand() as r order by r")
+        await runner.run()
+        values = [row["r"] for row in runner.results]
+        assert values == sorted(values)
+
+    @pytest.mark.asyncio
+    async def test_order_by_mixed_directions_with_nulls(self):
+        """Test ORDER BY with mixed directions places nulls and keeps ties stable."""
+        runner = Runner(
+            "unwind [{n: 'b', a: 1, i: 0}, {n: null, a: 2, i: 1}, {n: 'a', a: null, i: 2}, "
+            "{n: 'a', a: 3, i: 3}, {n: 'b', a: 1, i: 4}] as r "
+            "return r.i as i order by r.n asc, r.a desc"
+        )
+        await runner.run()
+        assert [row["i"] for row in runner.results] == [1, 3, 2, 0, 4]
+
     @pytest.mark.asyncio
     async def test_order_by_with_strings(self):
         """Test ORDER BY with string values."""
@@ -3,7 +3,9 @@
 import pytest
 from flowquery.graph.data import Data
 from flowquery.graph.node_data import NodeData
+from flowquery.graph.relationship import Relationship
 from flowquery.graph.relationship_data import RelationshipData
+from flowquery.graph.relationship_match_collector import RelationshipMatchCollector
 
 
 class TestDataIteration:
@@ -71,3 +73,32 @@ class TestRelationshipDataFind:
         assert data.current() == {"left_id": "2", "right_id": "3", "type": "COLLEAGUE", "id": "r2"}
         assert data.find("2") is False
         assert data.find("4") is False
+
+    def test_relationship_data_find_per_hop_cursors(self):
+        """Test that each hop keeps its own find cursor."""
+        records = [
+            {"left_id": "1", "right_id": "2"},
+            {"left_id": "1", "right_id": "3"},
+        ]
+        data = RelationshipData(records)
+        assert data.find("1", 0) is True
+        assert data.find("1", 1) is True
+        assert data.current(1) == {"left_id": "1", "right_id": "2"}
+        assert data.find("1", 0) is True
+        assert data.current(0) == {"left_id": "1", "right_id": "3"}
+        data.reset()
+        assert data.find("1", 1) is True
+        assert data.current(1) == {"left_id": "1", "right_id": "2"}
+
+    def test_match_collector_cycle_check_with_repeated_ids(self):
+        """Test that popping a repeated id keeps the earlier occurrence on the path."""
+        collector = RelationshipMatchCollector()
+        relationship = Relationship()
+        collector.push(relationship, "1")
+        collector.push(relationship, "2")
+        collector.push(relationship, "1")
+        collector.pop()
+        assert collector.is_circular("1") is True
+        collector.pop()
+        collector.pop()
+        assert collector.is_circular("1") is False
@@ -1,5 +1,7 @@
 """Tests for graph pattern matching."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch
 from flowquery.compute.runner import Runner
@@ -238,3 +240,143 @@ class TestMatch:
 
         physical_node.data = original_data
         await Runner("DELETE VIRTUAL (:CacheItem)").run()
+
+    @pytest.mark.asyncio
+    async def test_get_node_lookup_invalidated_on_registry_change(self):
+        """A memoized get_node lookup should follow re-registration and removal."""
+        db = Database.get_instance()
+        node = PhysicalNode(None, "EpochItem")
+        first = PhysicalNode(None, "EpochItem")
+        db.add_node(first, Parser().parse("RETURN 1 AS id"))
+        registered = db.get_node(node)
+        assert registered is db.get_node(node)
+
+        db.add_node(first, Parser().parse("RETURN 2 AS id"))
+        assert db.get_node(node) is not registered
+
+        db.remove_node(first)
+        assert db.get_node(node) is None
+
+    @pytest.mark.asyncio
+    async def test_relationship_with_multiple_property_constraints(self):
+        """Every relationship property constraint must match, not just the first."""
+        await Runner("""
+            CREATE VIRTUAL (:MultiPropCity) AS {
+                UNWIND [{id: 1}, {id: 2}, {id: 3}] AS r RETURN r.id AS id
+            }
+        """).run()
+        await Runner("""
+            CREATE VIRTUAL (:MultiPropCity)-[:MULTI_PROP_ROAD]-(:MultiPropCity) AS {
+                UNWIND [
+                    {left_id: 1, right_id: 2, lanes: 2, toll: false},
+                    {left_id: 1, right_id: 3, lanes: 2, toll: true}
+                ] AS r
+                RETURN r.left_id AS left_id, r.right_id AS right_id, r.lanes AS lanes, r.toll AS toll
+            }
+        """).run()
+        runner = Runner("""
+            MATCH (a:MultiPropCity)-[:MULTI_PROP_ROAD {lanes: 2, toll: true}]->(b:MultiPropCity)
+            RETURN a.id AS a, b.id AS b
+        """)
+        await runner.run()
+        assert runner.results == [{"a": 1, "b": 3}]
+        await Runner("DELETE VIRTUAL (:MultiPropCity)-[:MULTI_PROP_ROAD]-(:MultiPropCity)").run()
+        await Runner("DELETE VIRTUAL (:MultiPropCity)").run()
+
+    @pytest.mark.asyncio
+    async def test_relationship_property_mismatch_does_not_leak_into_match(self):
+        """A relationship record rejected by a property constraint is not part of the match."""
+        await Runner("""
+            CREATE VIRTUAL (:LeakCity) AS {
+                UNWIND [{id: 1}, {id: 2}, {id: 3}] AS r RETURN r.id AS id
+            }
+        """).run()
+        await Runner("""
+            CREATE VIRTUAL (:LeakCity)-[:LEAK_ROAD]-(:LeakCity) AS {
+                UNWIND [{left_id: 1, right_id: 2, x: 0}, {left_id: 1, right_id: 3, x: 1}] AS r
+                RETURN r.left_id AS left_id, r.right_id AS right_id, r.x AS x
+            }
+        """).run()
+        runner = Runner("MATCH (a:LeakCity)-[r:LEAK_ROAD {x: 1}]->(b:LeakCity) RETURN r.x AS x, b.id AS b")
+        await runner.run()
+        assert runner.results == [{"x": 1, "b": 3}]
+        await Runner("DELETE VIRTUAL (:LeakCity)-[:LEAK_ROAD]-(:LeakCity)").run()
+        await Runner("DELETE VIRTUAL (:LeakCity)").run()
+
+    @pytest.mark.asyncio
+    async def test_pattern_predicate_stops_at_first_match(self):
+        """Pattern predicates stop traversing at the first match without corrupting later rows."""
+        await Runner("""
+            CREATE VIRTUAL (:ExistsStop) AS {
+                UNWIND [{id: 1}, {id: 2}, {id: 3}, {id: 4}] AS r RETURN r.id AS id
+            }
+        """).run()
+        await Runner("""
+            CREATE VIRTUAL (:ExistsStop)-[:EXISTS_NEXT]-(:ExistsStop) AS {
+                UNWIND [
+                    {left_id: 1, right_id: 2},
+                    {left_id: 2, right_id: 3},
+                    {left_id: 3, right_id: 1},
+                    {left_id: 2, right_id: 1}
+                ] AS r
+                RETURN r.left_id AS left_id, r.right_id AS right_id
+            }
+        """).run()
+        runner = Runner("""
+            MATCH (a:ExistsStop)
+            WHERE (a)-[:EXISTS_NEXT]->(:ExistsStop)-[:EXISTS_NEXT]->(:ExistsStop)
+            RETURN a.id AS a
+        """)
+        await runner.run()
+        assert runner.results == [{"a": 1}, {"a": 2}, {"a": 3}]
+        await Runner("DELETE VIRTUAL (:ExistsStop)-[:EXISTS_NEXT]-(:ExistsStop)").run()
+        await Runner("DELETE VIRTUAL (:ExistsStop)").run()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_data_reads_share_one_execution(self):
+        """Concurrent reads of the same virtual node execute its statement once."""
+        node = PhysicalNode(None, "InflightItem")
+        node.statement = Parser().parse("UNWIND [1, 2] AS i RETURN i AS id")
+        original_load = node._load
+        call_count = 0
+
+        async def tracking_load(args, provenance):
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0)
+            return await original_load(args, provenance)
+
+        node._load = tracking_load
+        first, second = await asyncio.gather(node.data(), node.data())
+        assert call_count == 1
+        assert first == [{"id": 1}, {"id": 2}]
+        assert second is first
+
+        await node.data()
+        assert call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_schema_sample_excludes_type_tag_after_match(self):
+        """MATCH must not modify cached relationship records, and schema() skips _type."""
+        await Runner("""
+            CREATE STATIC VIRTUAL (:TagCity) AS {
+                UNWIND [{id: 1}, {id: 2}] AS r RETURN r.id AS id
+            }
+        """).run()
+        await Runner("""
+            CREATE STATIC VIRTUAL (:TagCity)-[:TAG_ROAD]-(:TagCity) AS {
+                UNWIND [{left_id: 1, right_id: 2, km: 5}] AS r
+                RETURN r.left_id AS left_id, r.right_id AS right_id, r.km AS km
+            }
+        """).run()
+        physical = next(iter(Database.get_instance().relationships["TAG_ROAD"].values()))
+        records = await physical.data()
+        snapshot = [dict(record) for record in records]
+        runner = Runner("MATCH (a:TagCity)-[r:TAG_ROAD]->(b:TagCity) RETURN r.km AS km")
+        await runner.run()
+        assert runner.results == [{"km": 5}]
+        assert await physical.data() is records
+        assert records == snapshot
+        assert physical.schema_sample(records) == {"km": 5}
+        await Runner("DELETE VIRTUAL (:TagCity)-[:TAG_ROAD]-(:TagCity)").run()
+        await Runner("DELETE VIRTUAL (:TagCity)").run()
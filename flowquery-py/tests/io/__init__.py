@@ -0,0 +1 @@
+"""IO tests package."""
@@ -0,0 +1,59 @@
+"""Tests for the FlowQuery command-line interface."""
+
+from flowquery.io.command_line import CommandLine
+
+
+class TestSplitScript:
+    """Test cases for splitting a script into statements."""
+
+    def test_statements_end_with_semicolon_lines(self):
+        """Each line ending in ";" closes a statement."""
+        assert CommandLine._split_script("RETURN 1;\nRETURN 2;\n") == ["RETURN 1", "RETURN 2"]
+
+    def test_trailing_statement_without_semicolon(self):
+        """A final statement may omit its ";"."""
+        assert CommandLine._split_script("RETURN 1;\nRETURN 2") == ["RETURN 1", "RETURN 2"]
+
+    def test_blank_lines_and_lone_semicolons_are_skipped(self):
+        """Blank lines and lines holding only ";" add no statements."""
+        script = "\n\nRETURN 1;\n;\n\n  ;  \nRETURN 2;\n\n"
+        assert CommandLine._split_script(script) == ["RETURN 1", "RETURN 2"]
+
+    def test_multi_line_statement(self):
+        """A statement runs over lines until one ends in ";"."""
+        script = "UNWIND [1, 2] AS n\nRETURN n;\nRETURN 3;"
+        assert CommandLine._split_script(script) == ["UNWIND [1, 2] AS n\nRETURN n", "RETURN 3"]
+
+    def test_repeated_semicolons_are_all_removed(self):
+        """Every trailing ";" is stripped, so ";;" ends a single statement."""
+        assert CommandLine._split_script("RETURN 1;;\nRETURN 2;") == ["RETURN 1", "RETURN 2"]
+
+    def test_empty_script(self):
+        """A script with no statements splits into nothing."""
+        assert CommandLine._split_script("\n  \n") == []
+
+
+class TestRunScript:
+    """Test cases for running a script file."""
+
+    def test_results_print_in_order(self, tmp_path, capsys):
+        """Every statement's results print, in script order."""
+        script = tmp_path / "script.fq"
+        script.write_text("RETURN 1 AS a;\nUNWIND [2, 3] AS b\nRETURN b;\nRETURN 4 AS c")
+        CommandLine().run_script(str(script))
+        assert capsys.readouterr().out.splitlines() == [
+            "[{'a': 1}]",
+            "[{'b': 2}, {'b': 3}]",
+            "[{'c': 4}]",
+        ]
+
+    def test_error_does_not_stop_later_statements(self, tmp_path, capsys):
+        """A failing statement prints its error and the rest still run."""
+        script = tmp_path / "script.fq"
+        script.write_text("RETURN 1 AS a;\nRETURN nosuchfunction() AS x;\nRETURN 2 AS b;")
+        CommandLine().run_script(str(script))
+        lines = capsys.readouterr().out.splitlines()
+        assert len(lines) == 3
+        assert lines[0] == "[{'a': 1}]"
+        assert lines[1].startswith("Error: ")
+        assert lines[2] == "[{'b': 2}]"
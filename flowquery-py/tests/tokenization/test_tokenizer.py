@@ -1,6 +1,7 @@
 """Tests for the FlowQuery tokenizer."""
 
 import pytest
+from flowquery.tokenization.token import Token
 from flowquery.tokenization.tokenizer import Tokenizer
 
 
@@ -21,6 +22,28 @@ class TestTokenizer:
         assert tokens is not None
         assert len(tokens) > 0
 
+    def test_escaped_quotes_and_braces_are_resolved(self):
+        """String and f-string tokens should resolve their escapes."""
+        tokens = Tokenizer('RETURN "say \\"hi\\"", f"{{x}} {y} }}"').tokenize()
+        strings = [t.value for t in tokens if t.is_string()]
+        f_strings = [t.value for t in tokens if t.is_f_string()]
+        assert strings == ['say "hi"']
+        assert f_strings == ["{x} ", " }"]
+
+    def test_token_equals(self):
+        """Token.equals() ignores identifier values but compares the rest."""
+        tokens = [
+            t for t in Tokenizer("WITH a, b, 1, 2 RETURN 1").tokenize()
+            if not t.is_whitespace_or_comment()
+        ]
+        with_, a, comma, b, _, one, _, two, return_, one_again = tokens
+        assert with_.equals(Token.WITH())
+        assert not with_.equals(return_)
+        assert a.equals(b)
+        assert not a.equals(comma)
+        assert one.equals(one_again)
+        assert not one.equals(two)
+
     def test_predicate_function(self):
         """Test predicate function tokenization."""
         tokenizer = Tokenizer("RETURN sum(n in [1, 2, 3] | n where n > 1)")